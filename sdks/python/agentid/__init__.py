@@ -77,11 +77,13 @@ from agentid.types import (
     IssuerInfo,
     Permission,
     PermissionConditions,
+    PermissionDecision,
     PermissionPolicyInfo,
     ReputationInfo,
     VerificationResult,
 )
-from agentid.verifier import CredentialVerifier, check_permission
+from agentid._permissions import PermissionIndex, check_permission
+from agentid.verifier import CredentialVerifier
 
 # Revocation
 from agentid.revocation import (
@@ -155,6 +157,8 @@ __all__ = [
     "IssuerInfo",
     "Permission",
     "PermissionConditions",
+    "PermissionDecision",
+    "PermissionIndex",
     "PermissionPolicyInfo",
     "ReputationInfo",
     "VerificationResult",
@@ -0,0 +1,345 @@
+"""
+Permission checking for AgentID credentials.
+
+This module is on the hot path of every authorized request, so it is kept
+fully typed and self-contained: wheels can be built with it compiled by
+mypyc (see pyproject.toml). The pure-Python module is used otherwise.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from agentid.types import (
+    CredentialPayload,
+    Permission,
+    PermissionDecision,
+    _compile_resource_pattern,
+    _literal_prefix,
+)
+
+__all__ = ["PermissionDecision", "PermissionIndex", "check_permission"]
+
+# Granted decisions carry no reason, so one instance serves every grant
+_GRANTED = PermissionDecision(True)
+
+# Action buckets with at least this many permissions are matched with one
+# combined regex, rather than calling each permission's matcher in turn
+COMBINED_MATCH_MIN = 16
+
+# Checks whether a resource matches a permission; None matches everything
+ResourceMatcher = Optional[Callable[[str], bool]]
+
+
+@dataclass
+class PermissionIndex:
+    """
+    A credential's permissions grouped by action.
+
+    check_permission only has to look at the permissions that mention the
+    requested action (or "*"), instead of scanning the whole list. Each
+    bucket keeps the permissions in their original order.
+
+    Usage:
+        index = PermissionIndex.from_credential(result.credential)
+        allowed = check_permission(index, resource=path, action="read")
+    """
+
+    # Permissions that mention each action, wildcard permissions merged in
+    by_action: dict[str, list[str | Permission]] = field(default_factory=dict)
+
+    # Permissions that apply to any action ("*")
+    wildcard: list[str | Permission] = field(default_factory=list)
+
+    # Literal resource prefixes of each bucket's permissions. A resource
+    # that starts with none of them can't match any, so the scan is skipped.
+    prefixes: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    wildcard_prefixes: tuple[str, ...] = ()
+
+    # Whether every action on every resource is granted (e.g. ["*"])
+    grants_all: bool = False
+
+    # Combined resource regexes for large buckets (see _combined_pattern),
+    # compiled on first use so an index checked only once never pays for
+    # them. Keyed by action; None is the wildcard bucket.
+    combined: dict[str | None, re.Pattern[str] | None] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    # Each bucket's resource matchers, parallel to its permissions (None for
+    # string permissions, which match any resource), looked up once here so
+    # check_permission doesn't go through the pattern cache per permission.
+    matchers: dict[str, list[ResourceMatcher]] = field(default_factory=dict)
+    wildcard_matchers: list[ResourceMatcher] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, permissions: Sequence[str | Permission | dict[str, Any]]) -> PermissionIndex:
+        """Build an index from a list of permissions."""
+        buckets: dict[str, list[tuple[int, str | Permission]]] = {}
+        wildcard: list[tuple[int, str | Permission]] = []
+
+        for position, perm in enumerate(permissions):
+            # Handle string permissions (legacy)
+            if isinstance(perm, str):
+                if perm == "*":
+                    wildcard.append((position, perm))
+                else:
+                    buckets.setdefault(perm, []).append((position, perm))
+                continue
+
+            # Handle structured permissions
+            if isinstance(perm, dict):
+                perm = Permission(**perm)
+
+            if "*" in perm.actions:
+                wildcard.append((position, perm))
+            else:
+                for action in dict.fromkeys(perm.actions):
+                    buckets.setdefault(action, []).append((position, perm))
+
+        by_action = {
+            action: [perm for _, perm in sorted(entries + wildcard, key=lambda e: e[0])]
+            for action, entries in buckets.items()
+        }
+        wildcard_perms = [perm for _, perm in wildcard]
+        return cls(
+            by_action=by_action,
+            wildcard=wildcard_perms,
+            prefixes={action: _prefixes(perms) for action, perms in by_action.items()},
+            wildcard_prefixes=_prefixes(wildcard_perms),
+            grants_all=_grants_all(permissions),
+            matchers={action: _matchers(perms) for action, perms in by_action.items()},
+            wildcard_matchers=_matchers(wildcard_perms),
+        )
+
+    @classmethod
+    def from_credential(cls, credential: CredentialPayload) -> PermissionIndex:
+        """Get the index for a credential, building it on first use."""
+        index = credential._permission_index
+        if index is None:
+            index = credential._permission_index = cls.build(credential.permissions)
+        return index  # type: ignore[no-any-return]
+
+    def candidates(self, action: str) -> list[str | Permission]:
+        """Get the permissions that could allow an action, in order."""
+        return self.by_action.get(action, self.wildcard)
+
+    def resource_matchers(self, action: str) -> list[ResourceMatcher]:
+        """Get the resource matchers of candidates(action), in the same order."""
+        return self.matchers.get(action, self.wildcard_matchers)
+
+    def could_match(self, action: str, resource: str) -> bool:
+        """Check whether any permission for an action could match a resource."""
+        return resource.startswith(self.prefixes.get(action, self.wildcard_prefixes))
+
+    def combined_pattern(self, action: str) -> re.Pattern[str] | None:
+        """Get the combined resource regex for an action's bucket, if it has one."""
+        key = action if action in self.by_action else None
+        try:
+            return self.combined[key]
+        except KeyError:
+            pattern = self.combined[key] = _combined_pattern(self.candidates(action))
+            return pattern
+
+
+def _combined_pattern(permissions: list[str | Permission]) -> re.Pattern[str] | None:
+    """
+    Compile a bucket's resource globs into one regex, in bucket order.
+
+    Each glob is a named alternative. re tries them left to right, so the
+    alternative that matches (match.lastgroup) is the first permission in
+    the bucket that matches the resource, as a scan would find.
+    """
+    if len(permissions) < COMBINED_MATCH_MIN:
+        return None
+
+    alternatives = []
+    for position, perm in enumerate(permissions):
+        glob = "*" if isinstance(perm, str) else perm.resource
+        alternatives.append(f"(?P<p{position}>{fnmatch.translate(glob)})")
+        if glob == "*":
+            break  # Later permissions are never reached
+    try:
+        return re.compile("|".join(alternatives))
+    except re.error:
+        return None  # e.g. clashing group names from older fnmatch
+
+
+def _grants_all(permissions: Sequence[str | Permission | dict[str, Any]]) -> bool:
+    """
+    Check whether permissions grant every action on every resource.
+
+    True when a "*" permission (or one for all actions on resource "*")
+    comes before any permission with conditions, since only conditions
+    can deny a request that an earlier permission would reach.
+    """
+    for perm in permissions:
+        if isinstance(perm, str):
+            if perm == "*":
+                return True
+            continue
+
+        if isinstance(perm, dict):
+            conditions, resource, actions = (
+                perm.get("conditions"),
+                perm.get("resource"),
+                perm.get("actions", ()),
+            )
+        else:
+            conditions, resource, actions = perm.conditions, perm.resource, perm.actions
+        if conditions is not None:
+            return False
+        if resource == "*" and "*" in actions:
+            return True
+    return False
+
+
+def _matchers(permissions: list[str | Permission]) -> list[ResourceMatcher]:
+    """Get the resource matchers of some permissions."""
+    return [
+        None if isinstance(perm, str) else _compile_resource_pattern(perm.resource)
+        for perm in permissions
+    ]
+
+
+def _prefixes(permissions: list[str | Permission]) -> tuple[str, ...]:
+    """Get the distinct literal resource prefixes of some permissions."""
+    # String permissions match any resource
+    prefixes = {
+        "" if isinstance(perm, str) else _literal_prefix(perm.resource) for perm in permissions
+    }
+    if "" in prefixes:
+        return ("",)
+    return tuple(sorted(prefixes))
+
+
+def check_permission(
+    permissions: Sequence[str | Permission | dict[str, Any]] | PermissionIndex,
+    *,
+    resource: str,
+    action: str,
+    context: dict[str, Any] | None = None,
+) -> PermissionDecision:
+    """
+    Check if permissions allow a specific action.
+
+    Args:
+        permissions: List of permissions from credential, or a
+            PermissionIndex built from it for repeated checks
+        resource: The resource being accessed
+        action: The action being attempted
+        context: Optional context (time, region, amount, etc.)
+
+    Returns:
+        Decision with granted (bool) and reason (str if denied)
+    """
+    if not isinstance(permissions, PermissionIndex):
+        # Building an index costs more than one scan; only reuse pays for it
+        return _scan(permissions, resource=resource, action=action, context=context)
+
+    if permissions.grants_all:
+        return _GRANTED
+
+    # Skip the scan if no permission's literal prefix fits the resource
+    if not permissions.could_match(action, resource):
+        return PermissionDecision(False, f"No permission for {action} on {resource}")
+
+    candidates = permissions.candidates(action)
+    matchers = permissions.resource_matchers(action)
+    first = 0
+
+    # Large buckets: find the first matching permission in one regex match
+    combined = permissions.combined_pattern(action)
+    if combined is not None:
+        match = combined.match(resource)
+        if match is None:
+            return PermissionDecision(False, f"No permission for {action} on {resource}")
+        assert match.lastgroup is not None
+        first = int(match.lastgroup[1:])
+
+    # The first permission whose resource matches (supports wildcards) decides
+    position = next(
+        (
+            i
+            for i in range(first, len(matchers))
+            if (matches := matchers[i]) is None or matches(resource)
+        ),
+        None,
+    )
+    if position is None:
+        return PermissionDecision(False, f"No permission for {action} on {resource}")
+
+    # String permissions in the bucket always match the action
+    perm = candidates[position]
+    if isinstance(perm, str):
+        return _GRANTED
+    return _check_conditions(perm, context)
+
+
+def _scan(
+    permissions: Sequence[str | Permission | dict[str, Any]],
+    *,
+    resource: str,
+    action: str,
+    context: dict[str, Any] | None,
+) -> PermissionDecision:
+    """Check a permission list in order, without building an index."""
+    for perm in permissions:
+        # Handle string permissions (legacy)
+        if isinstance(perm, str):
+            if perm == "*" or perm == action:
+                return _GRANTED
+            continue
+
+        # Handle structured permissions
+        if isinstance(perm, dict):
+            perm = Permission(**perm)
+
+        # Check action
+        if action not in perm.actions and "*" not in perm.actions:
+            continue
+
+        # Check resource match (supports wildcards)
+        if not _compile_resource_pattern(perm.resource)(resource):
+            continue
+
+        return _check_conditions(perm, context)
+
+    # No matching permission found
+    return PermissionDecision(False, f"No permission for {action} on {resource}")
+
+
+def _check_conditions(perm: Permission, context: dict[str, Any] | None) -> PermissionDecision:
+    """Check the conditions of the permission that matched a request."""
+    if perm.conditions and context:
+        # Check time window
+        if perm.conditions.valid_hours:
+            # Would need actual time checking logic
+            pass
+
+        # Check rate limits
+        if perm.conditions.max_requests_per_minute:
+            # Would need rate tracking
+            pass
+
+        # Check amount limits
+        if perm.conditions.max_transaction_amount:
+            amount = context.get("amount")
+            if amount and amount > perm.conditions.max_transaction_amount:
+                return PermissionDecision(
+                    False,
+                    f"Amount {amount} exceeds limit {perm.conditions.max_transaction_amount}",
+                )
+
+        # Check region
+        if perm.conditions.allowed_regions:
+            region = context.get("region")
+            if region and region not in perm.conditions.allowed_regions:
+                return PermissionDecision(False, f"Region {region} not allowed")
+
+    # All checks passed
+    return _GRANTED
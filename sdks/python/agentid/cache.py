@@ -1,9 +1,11 @@
 """Credential caching for AgentID SDK."""
 
+import heapq
 import threading
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
 T = TypeVar("T")
 
@@ -25,12 +27,22 @@ class CacheEntry(Generic[T]):
         return max(0, self.expires_at - time.time())
 
 
+# Number of independently locked shards in a CredentialCache
+SHARD_COUNT = 16
+
+
 class CredentialCache:
     """
     Thread-safe in-memory cache for credentials.
 
     This cache stores credential data with automatic expiration
     and provides thread-safe access.
+
+    Keys are spread over SHARD_COUNT shards with a lock each, so threads
+    working on different keys rarely wait on each other. Reads don't lock
+    at all (a dict lookup is atomic); only writes and evictions do. Expiry
+    uses the monotonic clock, so wall-clock adjustments don't expire
+    entries early or keep them alive.
     """
 
     def __init__(self, default_ttl: float = 300.0) -> None:
@@ -40,11 +52,36 @@ class CredentialCache:
         Args:
             default_ttl: Default time-to-live in seconds (default 5 minutes)
         """
-        self._cache: dict[str, CacheEntry[dict]] = {}
-        self._lock = threading.RLock()
+        # Entries are (value, expires_at, created_at) in monotonic time
+        self._shards: list[dict[str, tuple[Any, float, float]]] = [
+            {} for _ in range(SHARD_COUNT)
+        ]
+        self._locks = [threading.Lock() for _ in range(SHARD_COUNT)]
         self._default_ttl = default_ttl
 
-    def get(self, key: str) -> dict | None:
+        # Per-shard min-heaps of (expires_at, key), so cleanup only visits
+        # expired entries. Overwritten or deleted keys leave stale items,
+        # which are skipped when popped.
+        self._heaps: list[list[tuple[float, str]]] = [[] for _ in range(SHARD_COUNT)]
+
+    def _shard(self, key: str) -> tuple[threading.Lock, dict[str, tuple[Any, float, float]]]:
+        """Get the lock and shard that hold a key."""
+        index = hash(key) % SHARD_COUNT
+        return self._locks[index], self._shards[index]
+
+    @staticmethod
+    def _evict(
+        lock: threading.Lock,
+        shard: dict[str, tuple[Any, float, float]],
+        key: str,
+        entry: tuple[Any, float, float],
+    ) -> None:
+        """Delete an expired entry, unless it was replaced in the meantime."""
+        with lock:
+            if shard.get(key) is entry:
+                del shard[key]
+
+    def get(self, key: str) -> Any | None:
         """
         Get a value from the cache.
 
@@ -54,19 +91,47 @@ class CredentialCache:
         Returns:
             The cached value, or None if not found or expired
         """
-        with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                return None
-            if entry.is_expired():
-                del self._cache[key]
-                return None
-            return entry.value
+        lock, shard = self._shard(key)
+        entry = shard.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[1]:
+            self._evict(lock, shard, key, entry)
+            return None
+        return entry[0]
+
+    def get_entry(self, key: str) -> CacheEntry[Any] | None:
+        """
+        Get the cache entry for a key, including its timestamps.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cache entry (with wall-clock timestamps), or None if not
+            found or expired
+        """
+        lock, shard = self._shard(key)
+        entry = shard.get(key)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if now >= entry[1]:
+            self._evict(lock, shard, key, entry)
+            return None
+
+        value, expires_at, created_at = entry
+        offset = time.time() - now
+        return CacheEntry(
+            value=value,
+            expires_at=expires_at + offset,
+            created_at=created_at + offset,
+        )
 
     def set(
         self,
         key: str,
-        value: dict,
+        value: Any,
         ttl: float | None = None,
     ) -> None:
         """
@@ -80,11 +145,17 @@ class CredentialCache:
         if ttl is None:
             ttl = self._default_ttl
 
-        with self._lock:
-            self._cache[key] = CacheEntry(
-                value=value,
-                expires_at=time.time() + ttl,
-            )
+        now = time.monotonic()
+        expires_at = now + ttl
+        index = hash(key) % SHARD_COUNT
+        shard, heap = self._shards[index], self._heaps[index]
+        with self._locks[index]:
+            shard[key] = (value, expires_at, now)
+            heapq.heappush(heap, (expires_at, key))
+            if len(heap) > 2 * len(shard) + 64:
+                # Mostly stale items: rebuild from the live entries
+                heap[:] = [(entry[1], k) for k, entry in shard.items()]
+                heapq.heapify(heap)
 
     def delete(self, key: str) -> bool:
         """
@@ -96,16 +167,40 @@ class CredentialCache:
         Returns:
             True if the key was found and deleted, False otherwise
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+        lock, shard = self._shard(key)
+        with lock:
+            return shard.pop(key, None) is not None
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """
+        Delete several values from the cache.
+
+        Args:
+            keys: The cache keys to delete
+
+        Returns:
+            Number of keys that were found and deleted
+        """
+        # Group keys by shard, so each shard's lock is taken once
+        by_shard: dict[int, list[str]] = {}
+        for key in keys:
+            by_shard.setdefault(hash(key) % SHARD_COUNT, []).append(key)
+
+        removed = 0
+        for index, shard_keys in by_shard.items():
+            shard = self._shards[index]
+            with self._locks[index]:
+                for key in shard_keys:
+                    if shard.pop(key, None) is not None:
+                        removed += 1
+        return removed
 
     def clear(self) -> None:
         """Clear all entries from the cache."""
-        with self._lock:
-            self._cache.clear()
+        for lock, shard, heap in zip(self._locks, self._shards, self._heaps):
+            with lock:
+                shard.clear()
+                heap.clear()
 
     def cleanup_expired(self) -> int:
         """
@@ -114,18 +209,22 @@ class CredentialCache:
         Returns:
             Number of entries removed
         """
-        with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items() if entry.is_expired()
-            ]
-            for key in expired_keys:
-                del self._cache[key]
-            return len(expired_keys)
+        removed = 0
+        for lock, shard, heap in zip(self._locks, self._shards, self._heaps):
+            with lock:
+                now = time.monotonic()
+                while heap and heap[0][0] <= now:
+                    expires_at, key = heapq.heappop(heap)
+                    entry = shard.get(key)
+                    # Skip keys since overwritten or deleted
+                    if entry is not None and entry[1] == expires_at:
+                        del shard[key]
+                        removed += 1
+        return removed
 
     def size(self) -> int:
         """Get the number of entries in the cache."""
-        with self._lock:
-            return len(self._cache)
+        return sum(len(shard) for shard in self._shards)
 
     def get_ttl(self, key: str) -> float | None:
         """
@@ -137,11 +236,11 @@ class CredentialCache:
         Returns:
             Remaining TTL in seconds, or None if key not found
         """
-        with self._lock:
-            entry = self._cache.get(key)
-            if entry is None or entry.is_expired():
-                return None
-            return entry.time_to_live()
+        entry = self._shard(key)[1].get(key)
+        if entry is None:
+            return None
+        ttl = entry[1] - time.monotonic()
+        return ttl if ttl > 0 else None
 
 
 # Global cache instance
@@ -21,6 +21,7 @@ from agentid.exceptions import (
     RateLimitError,
 )
 from agentid.signature import RequestSigner
+from agentid.transport import get_shared_async_client, get_shared_client
 from agentid.types import (
     CredentialPayload,
     CredentialStatus,
@@ -146,16 +147,15 @@ class AgentCredential:
         """Fetch credential data from the API (async)."""
         url = f"{self.api_base}/verify"
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url,
-                    json={"credential_id": self.credential_id},
-                    headers=self._get_api_headers(),
-                    timeout=30.0,
-                )
-            except httpx.RequestError as e:
-                raise NetworkError(f"Failed to connect to AgentID API: {e}") from e
+        try:
+            response = await get_shared_async_client().post(
+                url,
+                json={"credential_id": self.credential_id},
+                headers=self._get_api_headers(),
+                timeout=30.0,
+            )
+        except httpx.RequestError as e:
+            raise NetworkError(f"Failed to connect to AgentID API: {e}") from e
 
         return self._handle_verify_response(response)
 
@@ -164,7 +164,7 @@ class AgentCredential:
         url = f"{self.api_base}/verify"
 
         try:
-            response = httpx.post(
+            response = get_shared_client().post(
                 url,
                 json={"credential_id": self.credential_id},
                 headers=self._get_api_headers(),
@@ -344,6 +344,8 @@ class AgentCredential:
         headers = kwargs.pop("headers", {})
         headers.update(self.get_headers(method, url, body))
 
+        # A client per call: a pooled one would share its cookie jar between
+        # credentials calling the same host
         async with httpx.AsyncClient() as client:
             return await client.request(method, url, headers=headers, **kwargs)
 
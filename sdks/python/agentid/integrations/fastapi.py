@@ -34,9 +34,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Callable, Sequence
 
+from agentid._permissions import PermissionIndex, check_permission
 from agentid.exceptions import AgentIDError
 from agentid.types import CredentialPayload, VerificationResult
-from agentid.verifier import CredentialVerifier, check_permission
+from agentid.verifier import CredentialVerifier
 
 # Type checking imports
 try:
@@ -152,9 +153,6 @@ class AgentIDMiddleware(BaseHTTPMiddleware):  # type: ignore
         if self._is_excluded(request.url.path):
             return await call_next(request)
 
-        # Extract headers
-        headers = dict(request.headers)
-
         # Get body for signature verification (if needed)
         body: bytes | None = None
         if request.method in ("POST", "PUT", "PATCH"):
@@ -163,7 +161,7 @@ class AgentIDMiddleware(BaseHTTPMiddleware):  # type: ignore
         # Verify request
         try:
             result = await self.verifier.verify_request_async(
-                headers=headers,
+                headers=request.headers,
                 method=request.method,
                 url=str(request.url),
                 body=body,
@@ -210,20 +208,21 @@ class AgentIDMiddleware(BaseHTTPMiddleware):  # type: ignore
 
         # Check required permissions
         if self.config.required_permissions and result.credential:
+            index = PermissionIndex.from_credential(result.credential)
             for permission in self.config.required_permissions:
                 allowed = check_permission(
-                    result.credential.permissions,
+                    index,
                     resource=str(request.url.path),
                     action=permission,
                 )
-                if not allowed["granted"]:
+                if not allowed.granted:
                     return JSONResponse(
                         status_code=403,
                         content={
                             "error": "Permission denied",
                             "code": "PERMISSION_DENIED",
                             "required": permission,
-                            "reason": allowed.get("reason"),
+                            "reason": allowed.reason,
                         },
                     )
 
@@ -355,21 +354,22 @@ def require_permission(
                 detail={"error": "No credential", "code": "NO_CREDENTIAL"},
             )
 
+        index = PermissionIndex.from_credential(credential)
         for permission in permissions:
             allowed = check_permission(
-                credential.permissions,
+                index,
                 resource=str(request.url.path),
                 action=permission,
             )
 
-            if not allowed["granted"]:
+            if not allowed.granted:
                 raise HTTPException(
                     status_code=403,
                     detail={
                         "error": "Permission denied",
                         "code": "PERMISSION_DENIED",
                         "required": permission,
-                        "reason": allowed.get("reason"),
+                        "reason": allowed.reason,
                     },
                 )
 
@@ -514,14 +514,12 @@ class AgentIDVerifierDep:
 
     async def _verify(self, request: Request) -> VerificationResult:
         """Perform verification."""
-        headers = dict(request.headers)
-
         body: bytes | None = None
         if request.method in ("POST", "PUT", "PATCH"):
             body = await request.body()
 
         return await self.verifier.verify_request_async(
-            headers=headers,
+            headers=request.headers,
             method=request.method,
             url=str(request.url),
             body=body,
@@ -12,9 +12,10 @@ import logging
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable
+from typing import Annotated, Any, Callable, Literal, Union
 
 import httpx
+from pydantic import Field, TypeAdapter, ValidationError
 
 from agentid.cache import CredentialCache, get_global_cache
 
@@ -42,6 +43,65 @@ class RevocationEvent:
     reason: str | None = None
 
 
+@dataclass
+class RevocationEnvelope:
+    """Response body of the revocations polling endpoint."""
+
+    revocations: list[RevocationEvent] = field(default_factory=list)
+
+
+# Fallbacks for when a response or batch has a malformed entry: the entries
+# are then validated one at a time (see _validate_events), so a bad one
+# can't keep the others from being applied
+@dataclass
+class _RawRevocationEnvelope:
+    revocations: list[Any] = field(default_factory=list)
+
+
+# WebSocket messages, discriminated by their "type" field
+@dataclass
+class _RevocationMessage:
+    type: Literal["revocation"]
+    data: RevocationEvent
+
+
+@dataclass
+class _RevocationsBatchMessage:
+    type: Literal["revocations_batch"]
+    data: list[RevocationEvent]
+
+
+@dataclass
+class _RawRevocationsBatchMessage:
+    type: Literal["revocations_batch"]
+    data: list[Any]
+
+
+@dataclass
+class _PingMessage:
+    type: Literal["ping"]
+
+
+@dataclass
+class _ErrorMessage:
+    type: Literal["error"]
+    error: str = "Unknown error"
+
+
+_WebSocketMessage = Annotated[
+    Union[_RevocationMessage, _RevocationsBatchMessage, _PingMessage, _ErrorMessage],
+    Field(discriminator="type"),
+]
+
+# Validators are built once and decode raw JSON bytes straight into
+# dataclasses, skipping the intermediate dict and per-field lookups.
+_EVENT_ADAPTER = TypeAdapter(RevocationEvent)
+_ENVELOPE_ADAPTER = TypeAdapter(RevocationEnvelope)
+_WS_MESSAGE_ADAPTER: TypeAdapter[_WebSocketMessage] = TypeAdapter(_WebSocketMessage)
+_RAW_ENVELOPE_ADAPTER = TypeAdapter(_RawRevocationEnvelope)
+_RAW_BATCH_ADAPTER = TypeAdapter(_RawRevocationsBatchMessage)
+
+
 @dataclass
 class RevocationSubscriberConfig:
     """Configuration for RevocationSubscriber."""
@@ -238,17 +298,11 @@ class RevocationSubscriber:
             if response.status_code != 200:
                 raise Exception(f"Revocation check failed: {response.status_code}")
 
-            data = response.json()
+            revocations = self._parse_revocations(response.content)
             self._last_revocation_check = time.time()
 
-            for rev in data.get("revocations", []):
-                event = RevocationEvent(
-                    credential_id=rev["credential_id"],
-                    revoked_at=rev["revoked_at"],
-                    reason=rev.get("reason"),
-                )
-                events.append(event)
-                self._handle_revocation_event(event)
+            events.extend(revocations)
+            self._handle_revocation_events(events)
 
         except Exception as e:
             self._handle_error(e)
@@ -271,17 +325,11 @@ class RevocationSubscriber:
             if response.status_code != 200:
                 raise Exception(f"Revocation check failed: {response.status_code}")
 
-            data = response.json()
+            revocations = self._parse_revocations(response.content)
             self._last_revocation_check = time.time()
 
-            for rev in data.get("revocations", []):
-                event = RevocationEvent(
-                    credential_id=rev["credential_id"],
-                    revoked_at=rev["revoked_at"],
-                    reason=rev.get("reason"),
-                )
-                events.append(event)
-                self._handle_revocation_event(event)
+            events.extend(revocations)
+            self._handle_revocation_events(events)
 
         except Exception as e:
             self._handle_error(e)
@@ -322,31 +370,32 @@ class RevocationSubscriber:
 
             await send_pong()
 
-    async def _handle_ws_message(self, ws: Any, message: str) -> None:
+    async def _handle_ws_message(self, ws: Any, message: str | bytes) -> None:
         """Handle WebSocket message."""
-        import json
-
         try:
-            data = json.loads(message)
-        except json.JSONDecodeError:
+            msg = _WS_MESSAGE_ADAPTER.validate_json(message)
+        except ValidationError as e:
+            try:
+                batch = _RAW_BATCH_ADAPTER.validate_json(message)
+            except ValidationError:
+                # Ignore message types we don't handle, report anything else
+                if not any(error["type"] == "union_tag_invalid" for error in e.errors()):
+                    self._handle_error(e)
+                return
+            self._handle_revocation_events(self._validate_events(batch.data))
             return
 
-        msg_type = data.get("type")
+        if isinstance(msg, _RevocationMessage):
+            self._handle_revocation_events([msg.data])
 
-        if msg_type == "revocation":
-            event_data = data.get("data", {})
-            event = RevocationEvent(
-                credential_id=event_data.get("credential_id", ""),
-                revoked_at=event_data.get("revoked_at", ""),
-                reason=event_data.get("reason"),
-            )
-            self._handle_revocation_event(event)
+        elif isinstance(msg, _RevocationsBatchMessage):
+            self._handle_revocation_events(msg.data)
 
-        elif msg_type == "ping":
+        elif isinstance(msg, _PingMessage):
             await ws.send('{"type": "pong"}')
 
-        elif msg_type == "error":
-            self._handle_error(Exception(data.get("error", "Unknown error")))
+        elif isinstance(msg, _ErrorMessage):
+            self._handle_error(Exception(msg.error))
 
     async def _start_polling_async(self) -> None:
         """Start async polling."""
@@ -365,21 +414,50 @@ class RevocationSubscriber:
 
         self._poll_task = asyncio.create_task(poll_loop())
 
+    def _parse_revocations(self, body: bytes) -> list[RevocationEvent]:
+        """Parse a revocations response, reporting and skipping malformed entries."""
+        try:
+            return _ENVELOPE_ADAPTER.validate_json(body).revocations
+        except ValidationError:
+            envelope = _RAW_ENVELOPE_ADAPTER.validate_json(body)
+        return self._validate_events(envelope.revocations)
+
+    def _validate_events(self, entries: list[Any]) -> list[RevocationEvent]:
+        """Validate revocation entries, reporting and skipping malformed ones."""
+        events: list[RevocationEvent] = []
+        for entry in entries:
+            try:
+                events.append(_EVENT_ADAPTER.validate_python(entry))
+            except ValidationError as e:
+                self._handle_error(e)
+        return events
+
     def _handle_revocation_event(self, event: RevocationEvent) -> None:
         """Handle a revocation event."""
-        # Track revoked credential
-        self._revoked_credentials.add(event.credential_id)
+        self._handle_revocation_events([event])
+
+    def _handle_revocation_events(self, events: list[RevocationEvent]) -> None:
+        """Handle a batch of revocation events."""
+        if not events:
+            return
 
-        # Clear from cache
-        self.cache.delete(f"verify:{event.credential_id}")
-        self.cache.delete(f"cred:{event.credential_id}")
+        # Track revoked credentials
+        keys: list[str] = []
+        for event in events:
+            self._revoked_credentials.add(event.credential_id)
+            keys.append(f"verify:{event.credential_id}")
+            keys.append(f"cred:{event.credential_id}")
+
+        # Clear from cache in one call
+        self.cache.delete_many(keys)
 
         # Notify callback
         if self.on_revocation:
-            try:
-                self.on_revocation(event)
-            except Exception:
-                pass
+            for event in events:
+                try:
+                    self.on_revocation(event)
+                except Exception:
+                    pass
 
     def _handle_error(self, error: Exception) -> None:
         """Handle an error."""
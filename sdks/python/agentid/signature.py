@@ -1,14 +1,80 @@
 """Cryptographic signature utilities for AgentID."""
 
 import base64
+import binascii
 import hashlib
 import hmac
 import json
 import time
+from collections.abc import Iterable
+from enum import Enum
+from secrets import token_urlsafe
 from typing import Any
+from uuid import UUID
 
 from agentid.exceptions import SignatureError
 
+# orjson serializes several times faster (pip install agentid[orjson])
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# BLAKE3 is an optional, faster keyed hash for signing
+# (pip install agentid[blake3])
+try:
+    import blake3
+
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Leaf types orjson and json.dumps encode alike. Floats are formatted
+# differently (and NaN/Infinity written as null), so they aren't included.
+_PLAIN_JSON_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _orjson_reject(obj: Any) -> Any:
+    """orjson default= hook: leave every other type to json.dumps."""
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# orjson refuses to nest deeper than this
+_ORJSON_MAX_DEPTH = 254
+
+
+def _orjson_compatible(obj: Any) -> bool:
+    """
+    Check an object has no values orjson encodes differently from json.dumps.
+
+    That is floats, and UUID and Enum values, which orjson always encodes
+    but json.dumps rejects. Only plain dicts, lists and tuples are walked:
+    orjson passes anything else (subclasses, dataclasses, datetimes) to
+    _orjson_reject.
+
+    Walks one nesting level at a time and gives up past orjson's own depth
+    limit, so a self-referencing container can't loop forever.
+    """
+    level = [obj]
+    for _ in range(_ORJSON_MAX_DEPTH + 1):
+        if not level:
+            return True
+        deeper: list[Any] = []
+        for item in level:
+            kind = type(item)
+            if kind is dict:
+                deeper.extend(item.values())
+            elif kind is list or kind is tuple:
+                deeper.extend(item)
+            elif kind not in _PLAIN_JSON_TYPES and (
+                kind is float or isinstance(item, (UUID, Enum))
+            ):
+                return False
+        level = deeper
+    return False  # Too deep or cyclic; json.dumps decides
+
 
 def canonical_json(obj: Any) -> str:
     """
@@ -16,9 +82,137 @@ def canonical_json(obj: Any) -> str:
 
     Keys are sorted alphabetically for consistent hashing.
     """
+    if ORJSON_AVAILABLE and _orjson_compatible(obj):
+        try:
+            out = orjson.dumps(
+                obj,
+                default=_orjson_reject,
+                option=orjson.OPT_SORT_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_SUBCLASS,
+            )
+        except (TypeError, orjson.JSONEncodeError):
+            pass  # e.g. non-str keys, huge ints or other types; json.dumps decides
+        else:
+            # Only use it when it's byte-identical to json.dumps' output,
+            # which escapes all non-ASCII and DEL
+            if out.isascii() and b"\x7f" not in out:
+                return out.decode()
+
     return json.dumps(obj, sort_keys=True, separators=(",", ":"))
 
 
+# Size in bytes of a decoded request signature (SHA-256 or BLAKE3 digest)
+SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+# Signing algorithms, and the tag that marks a BLAKE3 signature on the wire.
+# SHA-256 signatures are untagged so existing verifiers keep accepting them.
+SIGNATURE_ALGORITHMS = ("sha256", "blake3")
+BLAKE3_TAG = "b3$"
+
+# BLAKE3 key derivation context (keyed mode needs exactly 32 bytes)
+_BLAKE3_CONTEXT = "agentid request signature v1"
+
+
+def _blake3_key(secret: str) -> bytes:
+    """Derive the 32-byte BLAKE3 key for a signing secret."""
+    return blake3.blake3(secret.encode("utf-8"), derive_key_context=_BLAKE3_CONTEXT).digest()
+
+
+def _keyed_hmac(secret: str) -> hmac.HMAC:
+    """
+    Get an HMAC-SHA256 keyed with a secret, to .copy() per message.
+
+    Keying hashes the padded secret, which costs two SHA-256 blocks;
+    copying the keyed state skips that. Callers that sign many messages
+    with one secret (e.g. RequestSigner) keep it for their own lifetime.
+    Secrets are deliberately not cached process-wide.
+    """
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _check_algorithm(algorithm: str) -> None:
+    """Raise if a signing algorithm is unknown or not installed."""
+    if algorithm not in SIGNATURE_ALGORITHMS:
+        raise ValueError(f"Unknown signature algorithm: {algorithm!r}")
+    if algorithm == "blake3" and not BLAKE3_AVAILABLE:
+        raise ImportError(
+            "blake3 is required for BLAKE3 signatures. "
+            "Install it with: pip install agentid[blake3]"
+        )
+
+
+def _signing_string(
+    method: str,
+    url: str,
+    body: str | bytes | None,
+    timestamp: int | str,
+    credential_id: str,
+) -> bytes:
+    """
+    Build the payload that is signed for an HTTP request.
+
+    The timestamp may be passed already formatted, e.g. when the caller
+    also needs it as a header value.
+    """
+    body_hash = ""
+    if body:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        body_hash = hashlib.sha256(body).hexdigest()
+
+    signing_string = f"{method.upper()}\n{url}\n{timestamp}\n{credential_id}\n{body_hash}"
+    return signing_string.encode("utf-8")
+
+
+def _compute_signature(
+    method: str,
+    url: str,
+    body: str | bytes | None,
+    timestamp: int,
+    credential_id: str,
+    secret: str | None = None,
+    algorithm: str = "sha256",
+    keyed: hmac.HMAC | None = None,
+) -> bytes:
+    """
+    Compute the raw signature digest for an HTTP request.
+
+    Callers signing many SHA-256 messages with one secret can pass keyed,
+    its _keyed_hmac(secret), to skip re-keying for each message.
+    """
+    message = _signing_string(method, url, body, timestamp, credential_id)
+
+    if algorithm == "blake3":
+        if secret:
+            return blake3.blake3(message, key=_blake3_key(secret)).digest()
+        return blake3.blake3(message).digest()
+
+    if keyed is not None:
+        mac = keyed.copy()
+        mac.update(message)
+        return mac.digest()
+
+    if secret:
+        # HMAC-SHA256 signature
+        return hmac.digest(secret.encode("utf-8"), message, "sha256")
+
+    # Simple SHA256 hash (for verification without secret)
+    return hashlib.sha256(message).digest()
+
+
+def _decode_signature(signature: str) -> bytes | None:
+    """Decode a base64 signature, or return None if it can't be one of ours."""
+    try:
+        provided = base64.b64decode(signature, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    if len(provided) != SIGNATURE_SIZE:
+        return None
+    return provided
+
+
 def generate_request_signature(
     method: str,
     url: str,
@@ -26,6 +220,7 @@ def generate_request_signature(
     timestamp: int,
     credential_id: str,
     secret: str | None = None,
+    algorithm: str = "sha256",
 ) -> str:
     """
     Generate a signature for an HTTP request.
@@ -40,31 +235,26 @@ def generate_request_signature(
         timestamp: Unix timestamp of the request
         credential_id: The credential ID
         secret: Optional secret for HMAC (if not using Ed25519)
+        algorithm: "sha256" (HMAC-SHA256) or "blake3" (keyed BLAKE3)
 
     Returns:
-        Base64-encoded signature string
+        Base64-encoded signature string, prefixed with "b3$" for BLAKE3
     """
-    # Build the signing payload
-    body_hash = ""
-    if body:
-        if isinstance(body, str):
-            body = body.encode("utf-8")
-        body_hash = hashlib.sha256(body).hexdigest()
-
-    signing_string = f"{method.upper()}\n{url}\n{timestamp}\n{credential_id}\n{body_hash}"
+    _check_algorithm(algorithm)
+    signature = _compute_signature(
+        method, url, body, timestamp, credential_id, secret, algorithm
+    )
+    encoded = base64.b64encode(signature).decode("utf-8")
+    return BLAKE3_TAG + encoded if algorithm == "blake3" else encoded
 
-    if secret:
-        # HMAC-SHA256 signature
-        signature = hmac.new(
-            secret.encode("utf-8"),
-            signing_string.encode("utf-8"),
-            hashlib.sha256,
-        ).digest()
-    else:
-        # Simple SHA256 hash (for verification without secret)
-        signature = hashlib.sha256(signing_string.encode("utf-8")).digest()
 
-    return base64.b64encode(signature).decode("utf-8")
+def _split_signature(signature: str) -> tuple[str, bytes | None]:
+    """Split a signature into its algorithm and decoded digest."""
+    if signature.startswith(BLAKE3_TAG):
+        if not BLAKE3_AVAILABLE:
+            return "blake3", None
+        return "blake3", _decode_signature(signature[len(BLAKE3_TAG) :])
+    return "sha256", _decode_signature(signature)
 
 
 def verify_request_signature(
@@ -80,6 +270,9 @@ def verify_request_signature(
     """
     Verify a request signature.
 
+    The algorithm is taken from the signature's tag. BLAKE3 signatures
+    fail verification if blake3 isn't installed.
+
     Args:
         signature: The signature to verify
         method: HTTP method
@@ -97,29 +290,65 @@ def verify_request_signature(
         SignatureError: If the timestamp is too old
     """
     # Check timestamp freshness
-    current_time = int(time.time())
+    current_time = time.time_ns() // 1_000_000_000
     if abs(current_time - timestamp) > max_age_seconds:
         raise SignatureError(f"Request timestamp too old (max age: {max_age_seconds}s)")
 
+    # Reject malformed signatures before hashing the body
+    algorithm, provided = _split_signature(signature)
+    if provided is None:
+        return False
+
     # Generate expected signature
-    expected = generate_request_signature(
-        method=method,
-        url=url,
-        body=body,
-        timestamp=timestamp,
-        credential_id=credential_id,
-        secret=secret,
+    expected = _compute_signature(
+        method, url, body, timestamp, credential_id, secret, algorithm
     )
 
     # Constant-time comparison
-    return hmac.compare_digest(signature, expected)
+    return hmac.compare_digest(provided, expected)
+
+
+def verify_request_signatures_batch(
+    items: Iterable[tuple[str, str, str, str | bytes | None, int, str]],
+    secret: str | None,
+    max_age_seconds: int = 300,
+) -> list[bool]:
+    """
+    Verify many request signatures made with the same secret.
+
+    Unlike verify_request_signature,
+    a stale timestamp gives False instead of raising, so one old request
+    doesn't fail the whole batch.
+
+    Args:
+        items: (signature, method, url, body, timestamp, credential_id) tuples
+        secret: The secret used for signing (None for unkeyed signatures)
+        max_age_seconds: Maximum age of each request (default 5 minutes)
+
+    Returns:
+        One result per item, True if its signature is valid
+    """
+    keyed = _keyed_hmac(secret) if secret else None
+    current_time = time.time_ns() // 1_000_000_000
+
+    results = []
+    for signature, method, url, body, timestamp, credential_id in items:
+        algorithm, provided = _split_signature(signature)
+        if provided is None or abs(current_time - timestamp) > max_age_seconds:
+            results.append(False)
+            continue
+
+        expected = _compute_signature(
+            method, url, body, timestamp, credential_id, secret, algorithm, keyed
+        )
+        results.append(hmac.compare_digest(provided, expected))
+
+    return results
 
 
 def generate_nonce() -> str:
     """Generate a random nonce for request uniqueness."""
-    import secrets
-
-    return secrets.token_urlsafe(16)
+    return token_urlsafe(16)
 
 
 class RequestSigner:
@@ -134,6 +363,7 @@ class RequestSigner:
         self,
         credential_id: str,
         signing_secret: str | None = None,
+        algorithm: str = "sha256",
     ) -> None:
         """
         Initialize the request signer.
@@ -141,9 +371,18 @@ class RequestSigner:
         Args:
             credential_id: The credential ID to sign requests with
             signing_secret: Optional secret for HMAC signing
+            algorithm: "sha256" (default) or "blake3", which is faster but
+                needs blake3 installed on both ends
         """
+        _check_algorithm(algorithm)
         self.credential_id = credential_id
         self.signing_secret = signing_secret
+        self.algorithm = algorithm
+
+        # Keyed HMAC state, copied for each request
+        self._prehmac = (
+            _keyed_hmac(signing_secret) if signing_secret and algorithm == "sha256" else None
+        )
 
     def sign_request(
         self,
@@ -162,21 +401,52 @@ class RequestSigner:
         Returns:
             Dictionary of headers to include in the request
         """
-        timestamp = int(time.time())
+        timestamp = time.time_ns() // 1_000_000_000
+        timestamp_str = str(timestamp)
         nonce = generate_nonce()
 
-        signature = generate_request_signature(
-            method=method,
-            url=url,
-            body=body,
-            timestamp=timestamp,
-            credential_id=self.credential_id,
-            secret=self.signing_secret,
-        )
+        if self._prehmac is not None:
+            mac = self._prehmac.copy()
+            mac.update(_signing_string(method, url, body, timestamp_str, self.credential_id))
+            signature = base64.b64encode(mac.digest()).decode("utf-8")
+        else:
+            signature = generate_request_signature(
+                method=method,
+                url=url,
+                body=body,
+                timestamp=timestamp,
+                credential_id=self.credential_id,
+                secret=self.signing_secret,
+                algorithm=self.algorithm,
+            )
 
         return {
             "X-AgentID-Credential": self.credential_id,
-            "X-AgentID-Timestamp": str(timestamp),
+            "X-AgentID-Timestamp": timestamp_str,
             "X-AgentID-Nonce": nonce,
             "X-AgentID-Signature": signature,
         }
+
+    def verify_batch(
+        self,
+        items: Iterable[tuple[str, str, str, str | bytes | None, int]],
+        max_age_seconds: int = 300,
+    ) -> list[bool]:
+        """
+        Verify signatures on several requests made with this credential.
+
+        Args:
+            items: (signature, method, url, body, timestamp) tuples
+            max_age_seconds: Maximum age of each request (default 5 minutes)
+
+        Returns:
+            One result per item, True if its signature is valid
+        """
+        return verify_request_signatures_batch(
+            (
+                (signature, method, url, body, timestamp, self.credential_id)
+                for signature, method, url, body, timestamp in items
+            ),
+            self.signing_secret,
+            max_age_seconds,
+        )
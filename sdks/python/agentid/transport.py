@@ -0,0 +1,372 @@
+"""
+HTTP transports used by CredentialVerifier to call the AgentID API.
+
+The default HttpxTransport keeps pooled httpx clients open between calls.
+For throughput-critical async services, AiohttpTransport sends the async
+path through aiohttp instead (pip install agentid[aiohttp]).
+
+Usage:
+    from agentid import CredentialVerifier
+    from agentid.transport import AiohttpTransport
+
+    verifier = CredentialVerifier(transport=AiohttpTransport())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import functools
+import json
+import ssl
+import threading
+import weakref
+from collections.abc import Awaitable, Mapping
+from typing import Any, Callable, NamedTuple, Protocol
+
+import httpx
+
+from agentid.exceptions import NetworkError
+
+# Default API base
+DEFAULT_API_BASE = "https://agentid.dev/api"
+
+# Connection pool limits for long-lived HTTP clients
+DEFAULT_POOL_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+
+# HTTP/2 lets concurrent verifications share one connection, but needs h2
+# (pip install agentid[http2])
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+
+@functools.cache
+def get_ssl_context() -> ssl.SSLContext:
+    """
+    Get the TLS context shared by the SDK's HTTP clients.
+
+    Building a context loads and parses the CA bundle, which costs a few
+    milliseconds. httpx would otherwise do that for every new client. The
+    context is built by httpx, so SSL_CERT_FILE and SSL_CERT_DIR are
+    honored just as they are by httpx's own default.
+    """
+    return httpx.create_ssl_context()
+
+
+# Pooled clients shared by callers without a transport of their own.
+# Async clients are bound to the event loop they were created on, so
+# there is one per loop.
+_shared_client: httpx.Client | None = None
+_shared_client_lock = threading.Lock()
+_shared_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_client() -> httpx.Client:
+    """
+    Get the process-wide pooled sync HTTP client.
+
+    Reusing it keeps connections alive between calls, instead of paying
+    for a new TCP and TLS handshake each time.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        with _shared_client_lock:
+            if _shared_client is None or _shared_client.is_closed:
+                _shared_client = httpx.Client(
+                    http2=HTTP2_AVAILABLE,
+                    limits=DEFAULT_POOL_LIMITS,
+                    verify=get_ssl_context(),
+                )
+                atexit.register(_shared_client.close)
+    return _shared_client
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """Get the pooled async HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _shared_async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _shared_async_clients[loop] = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=DEFAULT_POOL_LIMITS,
+            verify=get_ssl_context(),
+        )
+        _close_on_loop_shutdown(client.aclose)
+    return client
+
+
+# Tasks waiting to close per-loop clients; the loop only keeps weak
+# references to its tasks
+_loop_closers: set[asyncio.Task[None]] = set()
+
+
+def _close_on_loop_shutdown(aclose: Callable[[], Awaitable[None]]) -> None:
+    """
+    Call aclose when the running event loop shuts down.
+
+    asyncio.run cancels the tasks still pending when its main coroutine
+    returns and lets them finish before closing the loop, so a task that
+    waits until it is cancelled gets to close a per-loop client on the
+    loop it belongs to.
+    """
+
+    async def wait_then_close() -> None:
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await aclose()
+
+    task = asyncio.get_running_loop().create_task(wait_then_close())
+    _loop_closers.add(task)
+    task.add_done_callback(_loop_closers.discard)
+
+
+# Headers for pre-encoded JSON bodies
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class TransportResponse(NamedTuple):
+    """Status, headers and raw body of an API response."""
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+
+
+class VerifierTransport(Protocol):
+    """
+    Sends JSON POST requests to the AgentID API.
+
+    Paths are relative to the transport's API base. Connection failures
+    are raised as NetworkError.
+    """
+
+    def post_json(self, path: str, body: dict[str, Any]) -> TransportResponse:
+        """POST a JSON body (sync)."""
+        ...
+
+    async def post_json_async(self, path: str, body: dict[str, Any]) -> TransportResponse:
+        """POST a JSON body (async)."""
+        ...
+
+    def close(self) -> None:
+        """Release sync resources."""
+        ...
+
+    async def aclose(self) -> None:
+        """Release all resources."""
+        ...
+
+
+def _encode_json(body: dict[str, Any]) -> bytes:
+    """Encode a request body as compact JSON."""
+    return json.dumps(body, separators=(",", ":")).encode()
+
+
+class HttpxTransport:
+    """
+    Transport backed by pooled httpx clients, created on first use.
+
+    With HTTP/2, concurrent lookups are multiplexed as streams over one
+    connection instead of each taking a connection from the pool.
+    """
+
+    def __init__(
+        self,
+        api_base: str = DEFAULT_API_BASE,
+        *,
+        timeout: float = 30.0,
+        http2: bool | None = None,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            api_base: Base URL for AgentID API
+            timeout: Request timeout in seconds
+            http2: Whether to negotiate HTTP/2 (default: if h2 is installed)
+            transport: httpx transport for the sync client, e.g.
+                httpx.MockTransport in tests (default: connection pool)
+            async_transport: httpx transport for the async client
+        """
+        if http2 and not HTTP2_AVAILABLE:
+            raise ImportError(
+                "h2 is required for HTTP/2. "
+                "Install it with: pip install agentid[http2]"
+            )
+        self.api_base = api_base.rstrip("/")
+        self.timeout = timeout
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
+        self._transport = transport
+        self._async_transport = async_transport
+        self._sync_client: httpx.Client | None = None
+        self._sync_client_finalizer: weakref.finalize[[], HttpxTransport] | None = None
+
+        # Async clients are bound to the event loop they were created on,
+        # so there is one per loop (e.g. one per asyncio.run call)
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+
+        # Absolute URLs by path, so requests skip joining with base_url
+        self._urls: dict[str, httpx.URL] = {}
+
+    def _url(self, path: str) -> httpx.URL:
+        """Get the absolute URL for an API path."""
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = httpx.URL(self.api_base + path)
+        return url
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the pooled async HTTP client for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._async_clients[loop] = httpx.AsyncClient(
+                base_url=self.api_base,
+                http2=self.http2,
+                limits=DEFAULT_POOL_LIMITS,
+                timeout=self.timeout,
+                verify=get_ssl_context(),
+                transport=self._async_transport,
+            )
+            _close_on_loop_shutdown(client.aclose)
+        return client
+
+    def _get_sync_client(self) -> httpx.Client:
+        """Get the pooled sync HTTP client, creating it if needed."""
+        if self._sync_client is None or self._sync_client.is_closed:
+            self._sync_client = httpx.Client(
+                base_url=self.api_base,
+                http2=self.http2,
+                limits=DEFAULT_POOL_LIMITS,
+                timeout=self.timeout,
+                verify=get_ssl_context(),
+                transport=self._transport,
+            )
+            # Close it when the transport is collected or at exit, without
+            # the exit hook keeping either alive
+            self._sync_client_finalizer = weakref.finalize(self, self._sync_client.close)
+        return self._sync_client
+
+    def post_json(self, path: str, body: dict[str, Any]) -> TransportResponse:
+        """POST a JSON body (sync)."""
+        try:
+            response = self._get_sync_client().post(
+                self._url(path), content=_encode_json(body), headers=_JSON_HEADERS
+            )
+        except httpx.RequestError as e:
+            raise NetworkError(f"Request failed: {e}") from e
+        return TransportResponse(response.status_code, response.headers, response.content)
+
+    async def post_json_async(self, path: str, body: dict[str, Any]) -> TransportResponse:
+        """POST a JSON body (async)."""
+        try:
+            response = await self._get_async_client().post(
+                self._url(path), content=_encode_json(body), headers=_JSON_HEADERS
+            )
+        except httpx.RequestError as e:
+            raise NetworkError(f"Request failed: {e}") from e
+        return TransportResponse(response.status_code, response.headers, response.content)
+
+    def close(self) -> None:
+        """Close the pooled sync HTTP client."""
+        if self._sync_client_finalizer is not None:
+            self._sync_client_finalizer()
+        self._sync_client = None
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients."""
+        # Clients of other loops can't be closed from this one
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+        self.close()
+
+
+class AiohttpTransport(HttpxTransport):
+    """
+    Transport that sends async requests through aiohttp.
+
+    aiohttp has lower per-request overhead than httpx for small JSON
+    POSTs. Sync requests still go through httpx.
+    """
+
+    def __init__(
+        self,
+        api_base: str = DEFAULT_API_BASE,
+        *,
+        timeout: float = 30.0,
+        limit: int = 1000,
+        limit_per_host: int = 100,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            api_base: Base URL for AgentID API
+            timeout: Request timeout in seconds
+            limit: Max open connections
+            limit_per_host: Max open connections to the API host
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError(
+                "aiohttp is required for AiohttpTransport. "
+                "Install it with: pip install aiohttp"
+            )
+        super().__init__(api_base, timeout=timeout)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        # Sessions are bound to their event loop too, so one per loop
+        self._sessions: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, aiohttp.ClientSession
+        ] = weakref.WeakKeyDictionary()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the aiohttp session for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            session = self._sessions[loop] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=300,
+                    ssl=get_ssl_context(),
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            _close_on_loop_shutdown(session.close)
+        return session
+
+    async def post_json_async(self, path: str, body: dict[str, Any]) -> TransportResponse:
+        """POST a JSON body (async)."""
+        try:
+            async with self._get_session().post(self.api_base + path, json=body) as response:
+                content = await response.read()
+                return TransportResponse(response.status, response.headers, content)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise NetworkError(f"Request failed: {e}") from e
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session and pooled HTTP clients."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+        await super().aclose()
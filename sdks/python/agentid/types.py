@@ -1,10 +1,13 @@
 """AgentID SDK Type Definitions."""
 
+import fnmatch
+import functools
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class CredentialStatus(str, Enum):
@@ -28,6 +31,8 @@ class IssuerInfo(BaseModel):
 class PermissionConditions(BaseModel):
     """Conditions that must be met for a permission to apply."""
 
+    model_config = ConfigDict(frozen=True)
+
     valid_hours: dict[str, str] | None = None  # {"start": "09:00", "end": "17:00"}
     valid_days: list[str] | None = None
     max_requests_per_minute: int | None = None
@@ -41,14 +46,157 @@ class PermissionConditions(BaseModel):
     approval_webhook: str | None = None
 
 
+# Characters with special meaning in fnmatch patterns
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Get the part of a resource glob before its first wildcard."""
+    for i, char in enumerate(pattern):
+        if char in _GLOB_CHARS:
+            return pattern[:i]
+    return pattern
+
+
+def _classify_resource_pattern(pattern: str) -> tuple[str, str]:
+    """
+    Classify a resource glob by where its "*" wildcards are.
+
+    Returns the kind ("exact", "prefix", "suffix", "infix" or "glob") and
+    the literal text to compare against. "users/*" is a prefix pattern,
+    "*.json" a suffix and "*/admin/*" an infix; anything with other
+    wildcards is a general glob.
+    """
+    leading = pattern.startswith("*")
+    trailing = len(pattern) > 1 and pattern.endswith("*")
+    literal = pattern[1 if leading else 0 : -1 if trailing else len(pattern)]
+
+    if _GLOB_CHARS.intersection(literal):
+        return "glob", pattern
+    if leading and trailing:
+        return "infix", literal
+    if leading:
+        return "suffix", literal
+    if trailing:
+        return "prefix", literal
+    return "exact", literal
+
+
+# Matchers are classes rather than closures so that anything holding one
+# (a PermissionIndex, and the credential that caches it) can be pickled.
+
+
+class _PrefixMatch:
+    __slots__ = ("literal",)
+
+    def __init__(self, literal: str) -> None:
+        self.literal = literal
+
+    def __call__(self, resource: str) -> bool:
+        return resource.startswith(self.literal)
+
+
+class _SuffixMatch(_PrefixMatch):
+    __slots__ = ()
+
+    def __call__(self, resource: str) -> bool:
+        return resource.endswith(self.literal)
+
+
+class _InfixMatch(_PrefixMatch):
+    __slots__ = ()
+
+    def __call__(self, resource: str) -> bool:
+        return self.literal in resource
+
+
+class _GlobMatch:
+    __slots__ = ("regex",)
+
+    def __init__(self, regex: re.Pattern[str]) -> None:
+        self.regex = regex
+
+    def __call__(self, resource: str) -> bool:
+        return self.regex.match(resource) is not None
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_resource_pattern(pattern: str) -> Callable[[str], bool]:
+    """
+    Compile a resource glob (e.g. "https://api.example.com/users/*").
+
+    Returns a function that checks whether a resource matches. Patterns
+    whose only wildcards are a leading and/or trailing "*", the common
+    cases, become a string comparison instead of a regex.
+    """
+    kind, literal = _classify_resource_pattern(pattern)
+    if kind == "exact":
+        return literal.__eq__
+    if kind == "prefix":
+        return _PrefixMatch(literal)
+    if kind == "suffix":
+        return _SuffixMatch(literal)
+    if kind == "infix":
+        return _InfixMatch(literal)
+    return _GlobMatch(re.compile(fnmatch.translate(pattern)))
+
+
 class Permission(BaseModel):
     """A structured permission."""
 
+    model_config = ConfigDict(frozen=True)
+
     resource: str
-    actions: list[str]
+    actions: tuple[str, ...]
     conditions: PermissionConditions | None = None
 
 
+class PermissionDecision(NamedTuple):
+    """
+    Result of a permission check.
+
+    Also supports the older dict-style access, e.g. decision["granted"],
+    decision.get("reason"), "reason" in decision and dict(decision), and
+    compares equal to the dict check_permission used to return (which has
+    no "reason" key for grants). Iterating still yields the tuple values.
+    """
+
+    granted: bool
+    reason: str | None = None
+
+    def keys(self) -> tuple[str, ...]:
+        """Get the keys of the equivalent dict."""
+        return self._fields if self.reason is not None else ("granted",)
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, str):
+            return key in self.keys()
+        return tuple.__contains__(self, key)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, dict):
+            return other == {key: getattr(self, key) for key in self.keys()}
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return tuple.__hash__(self)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, str):
+            if key in self._fields:
+                return getattr(self, key)
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a field by name, like dict.get(). Unset fields give default."""
+        value = getattr(self, key, None) if key in self._fields else None
+        return default if value is None else value
+
+
 class CredentialConstraints(BaseModel):
     """Constraints on a credential's validity."""
 
@@ -71,6 +219,9 @@ class CredentialPayload(BaseModel):
     metadata: dict[str, Any] | None = None
     signature: str
 
+    # PermissionIndex built on first permission check (see agentid.verifier)
+    _permission_index: Any = PrivateAttr(default=None)
+
 
 class PermissionPolicyInfo(BaseModel):
     """Permission policy info returned during verification."""
@@ -83,6 +234,9 @@ class PermissionPolicyInfo(BaseModel):
 class VerificationResult(BaseModel):
     """Result of verifying a credential."""
 
+    # Results are cached and shared between requests
+    model_config = ConfigDict(frozen=True)
+
     valid: bool
     credential: CredentialPayload | None = None
     error: str | None = None
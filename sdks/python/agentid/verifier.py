@@ -2,27 +2,167 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import hmac
+import math
+import random
+import threading
 import time
-from typing import Any, Callable, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, Callable, TypeVar, Union
 
-import httpx
+from pydantic import ValidationError
 
-from agentid.cache import CredentialCache, get_global_cache
+from agentid._permissions import PermissionDecision, PermissionIndex, check_permission
+from agentid.cache import CacheEntry, CredentialCache, get_global_cache
 from agentid.exceptions import (
     AgentIDError,
     CredentialExpiredError,
     CredentialInvalidError,
     CredentialNotFoundError,
     CredentialRevokedError,
-    NetworkError,
     RateLimitError,
-    SignatureError,
 )
-from agentid.signature import verify_request_signature
-from agentid.types import Permission, VerificationResult
+from agentid.signature import (
+    BLAKE3_TAG,
+    SIGNATURE_SIZE,
+    _compute_signature,
+    _keyed_hmac,
+    _split_signature,
+)
+from agentid.transport import (
+    DEFAULT_API_BASE,
+    HttpxTransport,
+    TransportResponse,
+    VerifierTransport,
+)
+from agentid.types import VerificationResult
+
+__all__ = [
+    "NEGATIVE_CACHE_ERROR_CODES",
+    "SIGNATURE_CACHE_SIZE",
+    "CredentialVerifier",
+    "require_credential",
+    # Defined in agentid._permissions, re-exported for existing imports
+    "PermissionDecision",
+    "PermissionIndex",
+    "check_permission",
+]
+
+# Failed verifications that won't change on retry, and can be cached briefly
+NEGATIVE_CACHE_ERROR_CODES = frozenset(
+    {"CREDENTIAL_NOT_FOUND", "CREDENTIAL_REVOKED", "CREDENTIAL_EXPIRED"}
+)
 
-# Default API base
-DEFAULT_API_BASE = "https://agentid.dev/api"
+# A request to verify: (headers, method, url, body)
+RequestParts = tuple[Mapping[str, str], str, str, Union[str, bytes, None]]
+
+# Max number of recently verified signatures to remember
+SIGNATURE_CACHE_SIZE = 10_000
+
+# Lengths of well-formed signature headers: a base64 digest, optionally
+# with the BLAKE3 tag
+_BASE64_SIGNATURE_LENGTH = 4 * math.ceil(SIGNATURE_SIZE / 3)
+_SIGNATURE_LENGTHS = frozenset(
+    (_BASE64_SIGNATURE_LENGTH, len(BLAKE3_TAG) + _BASE64_SIGNATURE_LENGTH)
+)
+
+# Results for malformed requests. VerificationResult is frozen, so these are
+# shared instead of being rebuilt (and re-validated) on every bad request.
+_MISSING_CREDENTIAL = VerificationResult(
+    valid=False,
+    error="Missing X-AgentID-Credential header",
+    error_code="MISSING_CREDENTIAL",
+)
+_MISSING_SIGNATURE = VerificationResult(
+    valid=False,
+    error="Missing signature headers",
+    error_code="MISSING_SIGNATURE",
+)
+_INVALID_TIMESTAMP = VerificationResult(
+    valid=False,
+    error="Invalid timestamp",
+    error_code="INVALID_TIMESTAMP",
+)
+_SIGNATURE_EXPIRED = VerificationResult(
+    valid=False,
+    error="Request signature expired",
+    error_code="SIGNATURE_EXPIRED",
+)
+_INVALID_SIGNATURE = VerificationResult(
+    valid=False,
+    error="Invalid request signature",
+    error_code="INVALID_SIGNATURE",
+)
+
+
+# AgentID request headers, as RequestSigner sends them and lowercased (as
+# most servers and proxies pass them on)
+_HEADER_NAMES = (
+    "X-AgentID-Credential",
+    "X-AgentID-Timestamp",
+    "X-AgentID-Nonce",
+    "X-AgentID-Signature",
+)
+_HEADER_SPELLINGS = (tuple(name.lower() for name in _HEADER_NAMES), _HEADER_NAMES)
+
+# AgentID request headers by their 11th character (either case), mapped to
+# their position in _extract_credential_info's result and lowercase name
+_HEADER_SLOTS = {
+    char: (index, name)
+    for index, name in enumerate(_HEADER_SPELLINGS[0])
+    for char in (name[10], name[10].upper())
+}
+
+
+def _parse_timestamp(value: str) -> int | None:
+    """
+    Parse a Unix timestamp header, or return None if it isn't one.
+
+    Never raises: the length cap keeps int() away from CPython's
+    digit limit on huge inputs, and non-ASCII digits like "²" are
+    rejected up front.
+    """
+    if len(value) > 12 or not (value.isascii() and value.isdigit()):
+        return None
+    return int(value)
+
+
+def _signature_cache_key(
+    signature: str,
+    timestamp: str,
+    credential_id: str,
+    method: str,
+    url: str,
+    body: str | bytes | None,
+) -> bytes:
+    """Cache key for a verified signature, covering everything it signs."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (signature, timestamp, credential_id, method.upper(), url, body or b""):
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        # Length-prefix each part so no two requests share a key
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.digest()
+
+
+def _discard_error(task: asyncio.Future[Any]) -> None:
+    """Retrieve a background task's exception so it isn't logged as unhandled."""
+    if not task.cancelled():
+        task.exception()
+
+
+class _InflightCall:
+    """A sync API lookup that other threads can wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: VerificationResult | None = None
+        self.error: BaseException | None = None
 
 
 class CredentialVerifier:
@@ -45,6 +185,11 @@ class CredentialVerifier:
 
         if result.valid:
             print(f"Request from: {result.credential.agent_name}")
+
+    The verifier keeps pooled HTTP connections to the AgentID API open
+    between calls. Reuse one instance, and call close() / aclose() (or use
+    it as a context manager) when done. Pass transport= to send API calls
+    through another HTTP client, e.g. agentid.transport.AiohttpTransport.
     """
 
     def __init__(
@@ -53,8 +198,12 @@ class CredentialVerifier:
         api_base: str = DEFAULT_API_BASE,
         cache: CredentialCache | None = None,
         cache_ttl: float = 300.0,  # Cache verifications for 5 minutes
+        negative_cache_ttl: float = 30.0,  # Cache not-found/revoked/expired for 30s
         verify_signature: bool = True,
         signature_max_age: int = 300,  # 5 minute max age for signatures
+        transport: VerifierTransport | None = None,
+        refresh_beta: float = 1.0,
+        signing_secret: str | None = None,
     ) -> None:
         """
         Initialize the verifier.
@@ -63,29 +212,100 @@ class CredentialVerifier:
             api_base: Base URL for AgentID API
             cache: Optional cache instance
             cache_ttl: How long to cache verification results
+            negative_cache_ttl: How long to cache results for credentials
+                that were not found, revoked or expired
             verify_signature: Whether to verify request signatures
             signature_max_age: Max age of request signatures in seconds
+            transport: HTTP transport for API calls (default: pooled httpx)
+            refresh_beta: How eagerly async lookups refresh cached results
+                in the background as they near expiry (0 disables)
+            signing_secret: Shared secret agents sign requests with. When
+                set, the signature itself is checked, not just its age
         """
         self.api_base = api_base.rstrip("/")
         self.cache = cache or get_global_cache()
         self.cache_ttl = cache_ttl
+        self.negative_cache_ttl = negative_cache_ttl
         self.verify_signature = verify_signature
         self.signature_max_age = signature_max_age
+        self.refresh_beta = refresh_beta
+        self.signing_secret = signing_secret
+
+        # Keyed HMAC state, copied for each signature check
+        self._keyed = _keyed_hmac(signing_secret) if signing_secret else None
+
+        self.transport = transport or HttpxTransport(self.api_base)
+
+        # In-flight API lookups, keyed by credential ID
+        self._inflight: dict[str, asyncio.Future[VerificationResult]] = {}
+        self._inflight_sync: dict[str, _InflightCall] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Recently verified signatures, cache key -> expiry time
+        self._verified_signatures: dict[bytes, float] = {}
+        self._verified_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the transport's sync HTTP resources."""
+        self.transport.close()
+
+    async def aclose(self) -> None:
+        """Close the transport's HTTP resources."""
+        await self.transport.aclose()
+
+    def __enter__(self) -> CredentialVerifier:
+        """Enter sync context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit sync context."""
+        self.close()
+
+    async def __aenter__(self) -> CredentialVerifier:
+        """Enter async context."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit async context."""
+        await self.aclose()
 
     def _extract_credential_info(
         self,
-        headers: dict[str, str],
+        headers: Mapping[str, str],
     ) -> tuple[str | None, str | None, str | None, str | None]:
         """Extract credential info from headers."""
-        # Normalize header names (case-insensitive)
-        normalized = {k.lower(): v for k, v in headers.items()}
-
-        credential_id = normalized.get("x-agentid-credential")
-        timestamp = normalized.get("x-agentid-timestamp")
-        nonce = normalized.get("x-agentid-nonce")
-        signature = normalized.get("x-agentid-signature")
+        # httpx / Starlette header objects are already case-insensitive
+        if hasattr(headers, "raw"):
+            return (
+                headers.get("x-agentid-credential"),
+                headers.get("x-agentid-timestamp"),
+                headers.get("x-agentid-nonce"),
+                headers.get("x-agentid-signature"),
+            )
 
-        return credential_id, timestamp, nonce, signature
+        # Plain mappings usually spell the names one of two ways, so try
+        # direct lookups before scanning
+        for credential_name, timestamp_name, nonce_name, signature_name in _HEADER_SPELLINGS:
+            credential_id = headers.get(credential_name)
+            if credential_id is None:
+                continue
+            timestamp = headers.get(timestamp_name)
+            signature = headers.get(signature_name)
+            if timestamp is not None and signature is not None:
+                return credential_id, timestamp, headers.get(nonce_name), signature
+            break
+
+        # Otherwise one pass, dispatching on the character after
+        # "x-agentid-" so each candidate is compared against one name only
+        found: list[str | None] = [None, None, None, None]
+        for key, value in headers.items():
+            if len(key) < 15 or (key[0] != "x" and key[0] != "X"):
+                continue
+            slot = _HEADER_SLOTS.get(key[10])
+            if slot is not None and key.lower() == slot[1]:
+                found[slot[0]] = value
+
+        return found[0], found[1], found[2], found[3]
 
     async def verify_credential_async(
         self,
@@ -96,6 +316,10 @@ class CredentialVerifier:
         """
         Verify a credential by ID (async).
 
+        Concurrent calls for the same credential share a single API request.
+        Cached results close to expiry may be refreshed in the background,
+        while the cached result is returned.
+
         Args:
             credential_id: The credential ID to verify
             use_cache: Whether to use cached results
@@ -105,31 +329,80 @@ class CredentialVerifier:
         """
         # Check cache
         if use_cache:
-            cache_key = f"verify:{credential_id}"
-            cached = self.cache.get(cache_key)
-            if cached:
-                return VerificationResult(**cached)
-
-        # Call API
-        url = f"{self.api_base}/verify"
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    url,
-                    json={"credential_id": credential_id},
-                    timeout=30.0,
-                )
-            except httpx.RequestError as e:
-                raise NetworkError(f"Failed to verify credential: {e}") from e
+            cached = self._get_cached_async(credential_id)
+            if cached is not None:
+                return cached
+
+        # Shield so one caller being cancelled doesn't fail the others
+        return await asyncio.shield(self._lookup_async(credential_id, use_cache))
+
+    def _get_cached_async(self, credential_id: str) -> VerificationResult | None:
+        """Get a cached verification result, refreshing it early if due."""
+        entry = self.cache.get_entry(f"verify:{credential_id}")
+        if entry is None:
+            return None
+        cached = self._to_result(entry.value)
+        if cached.valid and self._refresh_due(entry):
+            self._lookup_async(credential_id, True).add_done_callback(_discard_error)
+        return cached
+
+    def _lookup_async(
+        self,
+        credential_id: str,
+        use_cache: bool,
+    ) -> asyncio.Future[VerificationResult]:
+        """Join an in-flight API lookup for this credential, or start one."""
+        task = self._inflight.get(credential_id)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_async(credential_id, use_cache))
+            self._inflight[credential_id] = task
+            task.add_done_callback(
+                lambda done: self._inflight.pop(credential_id, None)
+                if self._inflight.get(credential_id) is done
+                else None
+            )
+        return task
 
-        result = self._handle_response(response)
+    def _refresh_due(self, entry: CacheEntry[Any]) -> bool:
+        """
+        Decide whether a cache hit should refresh the entry early.
 
-        # Cache successful verifications
-        if use_cache and result.valid:
-            cache_key = f"verify:{credential_id}"
-            self.cache.set(cache_key, result.model_dump(), ttl=self.cache_ttl)
+        XFetch-style probabilistic expiry: the chance of a refresh rises
+        sharply in the last ~10% of the TTL, so one request refreshes a hot
+        credential ahead of time instead of all of them missing at once.
+        """
+        if self.refresh_beta <= 0:
+            return False
+        delta = (entry.expires_at - entry.created_at) * 0.1
+        # 1 - random() is in (0, 1], so log() is defined
+        jitter = -delta * self.refresh_beta * math.log(1.0 - random.random())
+        return time.time() + jitter >= entry.expires_at
+
+    async def verify_credentials_async(
+        self,
+        credential_ids: list[str],
+        *,
+        use_cache: bool = True,
+    ) -> list[VerificationResult]:
+        """
+        Verify several credentials concurrently (async).
 
-        return result
+        Duplicate IDs are looked up once. Cache misses are fetched in
+        parallel over the pooled connection.
+
+        Args:
+            credential_ids: The credential IDs to verify
+            use_cache: Whether to use cached results
+
+        Returns:
+            Verification results, in the same order as credential_ids
+        """
+        unique_ids = list(dict.fromkeys(credential_ids))
+        results = await asyncio.gather(
+            *(self.verify_credential_async(cid, use_cache=use_cache) for cid in unique_ids)
+        )
+        by_id = dict(zip(unique_ids, results))
+        return [by_id[cid] for cid in credential_ids]
 
     def verify_credential(
         self,
@@ -140,6 +413,9 @@ class CredentialVerifier:
         """
         Verify a credential by ID (sync).
 
+        Concurrent calls from other threads for the same credential share
+        a single API request.
+
         Args:
             credential_id: The credential ID to verify
             use_cache: Whether to use cached results
@@ -149,32 +425,98 @@ class CredentialVerifier:
         """
         # Check cache
         if use_cache:
-            cache_key = f"verify:{credential_id}"
-            cached = self.cache.get(cache_key)
-            if cached:
-                return VerificationResult(**cached)
+            cached = self._get_cached(credential_id)
+            if cached is not None:
+                return cached
+
+        # Join an in-flight lookup for this credential, or start one
+        with self._inflight_lock:
+            call = self._inflight_sync.get(credential_id)
+            is_leader = call is None
+            if call is None:
+                call = self._inflight_sync[credential_id] = _InflightCall()
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            assert call.result is not None
+            return call.result
 
-        # Call API
-        url = f"{self.api_base}/verify"
         try:
-            response = httpx.post(
-                url,
-                json={"credential_id": credential_id},
-                timeout=30.0,
-            )
-        except httpx.RequestError as e:
-            raise NetworkError(f"Failed to verify credential: {e}") from e
+            call.result = self._fetch_sync(credential_id, use_cache)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight_sync.pop(credential_id, None)
+            call.done.set()
+
+    def _get_cached(self, credential_id: str) -> VerificationResult | None:
+        """Get a cached verification result."""
+        cached = self.cache.get(f"verify:{credential_id}")
+        if cached is None:
+            return None
+        return self._to_result(cached)
+
+    @staticmethod
+    def _to_result(cached: Any) -> VerificationResult:
+        """Turn a cached value into a verification result."""
+        if isinstance(cached, VerificationResult):
+            # Results are cached as validated objects, no need to re-parse
+            return cached
+        # Plain data, e.g. from a cache shared with another process
+        return VerificationResult.model_validate(cached)
+
+    def _cache_result(self, credential_id: str, result: VerificationResult) -> None:
+        """Cache a verification result fetched from the API."""
+        if result.valid:
+            self.cache.set(f"verify:{credential_id}", result, ttl=self.cache_ttl)
+        elif result.error_code in NEGATIVE_CACHE_ERROR_CODES:
+            # Absorb repeated lookups of bad credentials, but not for long
+            ttl = min(self.cache_ttl, self.negative_cache_ttl)
+            self.cache.set(f"verify:{credential_id}", result, ttl=ttl)
+
+    def invalidate(self, credential_id: str) -> bool:
+        """
+        Drop any cached verification result for a credential.
+
+        Call this when you learn a credential changed, e.g. from a
+        revocation webhook.
+
+        Args:
+            credential_id: The credential ID
+
+        Returns:
+            True if a cached result was removed
+        """
+        return self.cache.delete(f"verify:{credential_id}")
 
+    async def _fetch_async(self, credential_id: str, use_cache: bool) -> VerificationResult:
+        """Fetch a verification result from the API (async)."""
+        response = await self.transport.post_json_async(
+            "/verify", {"credential_id": credential_id}
+        )
+        result = self._handle_response(response)
+
+        if use_cache:
+            self._cache_result(credential_id, result)
+
+        return result
+
+    def _fetch_sync(self, credential_id: str, use_cache: bool) -> VerificationResult:
+        """Fetch a verification result from the API (sync)."""
+        response = self.transport.post_json("/verify", {"credential_id": credential_id})
         result = self._handle_response(response)
 
-        # Cache successful verifications
-        if use_cache and result.valid:
-            cache_key = f"verify:{credential_id}"
-            self.cache.set(cache_key, result.model_dump(), ttl=self.cache_ttl)
+        if use_cache:
+            self._cache_result(credential_id, result)
 
         return result
 
-    def _handle_response(self, response: httpx.Response) -> VerificationResult:
+    def _handle_response(self, response: TransportResponse) -> VerificationResult:
         """Handle verification API response."""
         if response.status_code == 429:
             retry_after = response.headers.get("Retry-After")
@@ -183,16 +525,130 @@ class CredentialVerifier:
                 retry_after=int(retry_after) if retry_after else None,
             )
 
+        # Parse and validate in one pass, straight from the response bytes
         try:
-            data = response.json()
-        except Exception as e:
+            return VerificationResult.model_validate_json(response.content)
+        except ValidationError as e:
             raise AgentIDError(f"Invalid response: {e}") from e
 
-        return VerificationResult(**data)
+    def _check_signature(
+        self,
+        credential_id: str,
+        timestamp: str | None,
+        signature: str | None,
+        method: str,
+        url: str,
+        body: str | bytes | None,
+    ) -> VerificationResult | None:
+        """Check the request signature, including its HMAC if we have the secret."""
+        if not timestamp or not signature:
+            return _MISSING_SIGNATURE
+
+        ts = _parse_timestamp(timestamp)
+        if ts is None:
+            return _INVALID_TIMESTAMP
+
+        now = time.time_ns() // 1_000_000_000
+        age = now - ts
+        if age > self.signature_max_age or -age > self.signature_max_age:
+            return _SIGNATURE_EXPIRED
+
+        if self.signing_secret is not None and not self._signature_matches(
+            credential_id, timestamp, ts, now, signature, method, url, body
+        ):
+            return _INVALID_SIGNATURE
+        return None
+
+    def _signature_matches(
+        self,
+        credential_id: str,
+        timestamp: str,
+        ts: int,
+        now: int,
+        signature: str,
+        method: str,
+        url: str,
+        body: str | bytes | None,
+    ) -> bool:
+        """
+        Check a request's HMAC signature.
+
+        Valid signatures are remembered until their timestamp goes stale,
+        so repeated requests skip the HMAC. Only the signature is cached:
+        the credential itself is still checked on every request.
+
+        Takes the timestamp both as sent and parsed, and the current time,
+        as already worked out by _check_signature.
+        """
+        assert self.signing_secret is not None
+        # Malformed signatures can't match; skip hashing the body for them
+        if len(signature) not in _SIGNATURE_LENGTHS:
+            return False
+
+        key = _signature_cache_key(signature, timestamp, credential_id, method, url, body)
+        expires_at = self._verified_signatures.get(key)
+        if expires_at is not None and expires_at > now:
+            return True
+
+        algorithm, provided = _split_signature(signature)
+        if provided is None:
+            return False
+        expected = _compute_signature(
+            method,
+            url,
+            body,
+            ts,
+            credential_id,
+            self.signing_secret,
+            algorithm,
+            keyed=self._keyed,
+        )
+        valid = hmac.compare_digest(provided, expected)
+
+        if valid:
+            expires_at = min(now + self.cache_ttl, ts + self.signature_max_age)
+            with self._verified_lock:
+                if len(self._verified_signatures) >= SIGNATURE_CACHE_SIZE:
+                    # Drop the oldest entry (dicts keep insertion order)
+                    del self._verified_signatures[next(iter(self._verified_signatures))]
+                self._verified_signatures[key] = expires_at
+        return valid
+
+    def _precheck_request(
+        self,
+        headers: Mapping[str, str],
+        method: str,
+        url: str,
+        body: str | bytes | None = None,
+    ) -> tuple[str | None, VerificationResult | None]:
+        """Run a request's local checks, returning its credential ID and any error."""
+        credential_id, timestamp, _, signature = self._extract_credential_info(headers)
+        return self._precheck_parts(credential_id, timestamp, signature, method, url, body)
+
+    def _precheck_parts(
+        self,
+        credential_id: str | None,
+        timestamp: str | None,
+        signature: str | None,
+        method: str,
+        url: str,
+        body: str | bytes | None,
+    ) -> tuple[str | None, VerificationResult | None]:
+        """Run the local checks on a request's AgentID header values."""
+        if not credential_id:
+            return None, _MISSING_CREDENTIAL
+
+        # Verify signature if enabled
+        if self.verify_signature:
+            error = self._check_signature(credential_id, timestamp, signature, method, url, body)
+            if error is not None:
+                return credential_id, error
+
+        return credential_id, None
 
     async def verify_request_async(
         self,
-        headers: dict[str, str],
+        headers: Mapping[str, str],
         method: str,
         url: str,
         body: str | bytes | None = None,
@@ -209,45 +665,53 @@ class CredentialVerifier:
         Returns:
             Verification result
         """
-        credential_id, timestamp, nonce, signature = self._extract_credential_info(headers)
+        credential_id, timestamp, _, signature = self._extract_credential_info(headers)
+        return await self.verify_request_parts_async(
+            credential_id, timestamp, signature, method, url, body
+        )
+
+    async def verify_request_parts_async(
+        self,
+        credential_id: str | None,
+        timestamp: str | None,
+        signature: str | None,
+        method: str,
+        url: str,
+        body: str | bytes | None = None,
+    ) -> VerificationResult:
+        """
+        Verify a request from its AgentID header values (async).
+
+        Lets frameworks pass the X-AgentID-Credential, -Timestamp and
+        -Signature values they already looked up, instead of a headers
+        mapping to search.
+
+        Args:
+            credential_id: X-AgentID-Credential header value
+            timestamp: X-AgentID-Timestamp header value
+            signature: X-AgentID-Signature header value
+            method: HTTP method
+            url: Request URL
+            body: Request body
 
+        Returns:
+            Verification result
+        """
         if not credential_id:
-            return VerificationResult(
-                valid=False,
-                error="Missing X-AgentID-Credential header",
-                error_code="MISSING_CREDENTIAL",
-            )
+            return _MISSING_CREDENTIAL
 
         # Verify signature if enabled
         if self.verify_signature:
-            if not timestamp or not signature:
-                return VerificationResult(
-                    valid=False,
-                    error="Missing signature headers",
-                    error_code="MISSING_SIGNATURE",
-                )
-
-            try:
-                ts = int(timestamp)
-                if abs(time.time() - ts) > self.signature_max_age:
-                    return VerificationResult(
-                        valid=False,
-                        error="Request signature expired",
-                        error_code="SIGNATURE_EXPIRED",
-                    )
-            except ValueError:
-                return VerificationResult(
-                    valid=False,
-                    error="Invalid timestamp",
-                    error_code="INVALID_TIMESTAMP",
-                )
+            error = self._check_signature(credential_id, timestamp, signature, method, url, body)
+            if error is not None:
+                return error
 
         # Verify credential
         return await self.verify_credential_async(credential_id)
 
     def verify_request(
         self,
-        headers: dict[str, str],
+        headers: Mapping[str, str],
         method: str,
         url: str,
         body: str | bytes | None = None,
@@ -264,121 +728,94 @@ class CredentialVerifier:
         Returns:
             Verification result
         """
-        credential_id, timestamp, nonce, signature = self._extract_credential_info(headers)
+        credential_id, error = self._precheck_request(headers, method, url, body)
+        if error is not None:
+            return error
+        assert credential_id is not None
 
-        if not credential_id:
-            return VerificationResult(
-                valid=False,
-                error="Missing X-AgentID-Credential header",
-                error_code="MISSING_CREDENTIAL",
-            )
+        # Verify credential
+        return self.verify_credential(credential_id)
 
-        # Verify signature if enabled
-        if self.verify_signature:
-            if not timestamp or not signature:
-                return VerificationResult(
-                    valid=False,
-                    error="Missing signature headers",
-                    error_code="MISSING_SIGNATURE",
-                )
-
-            try:
-                ts = int(timestamp)
-                if abs(time.time() - ts) > self.signature_max_age:
-                    return VerificationResult(
-                        valid=False,
-                        error="Request signature expired",
-                        error_code="SIGNATURE_EXPIRED",
-                    )
-            except ValueError:
-                return VerificationResult(
-                    valid=False,
-                    error="Invalid timestamp",
-                    error_code="INVALID_TIMESTAMP",
-                )
+    def verify_request_parts(
+        self,
+        credential_id: str | None,
+        timestamp: str | None,
+        signature: str | None,
+        method: str,
+        url: str,
+        body: str | bytes | None = None,
+    ) -> VerificationResult:
+        """
+        Verify a request from its AgentID header values (sync).
+
+        Args:
+            credential_id: X-AgentID-Credential header value
+            timestamp: X-AgentID-Timestamp header value
+            signature: X-AgentID-Signature header value
+            method: HTTP method
+            url: Request URL
+            body: Request body
+
+        Returns:
+            Verification result
+        """
+        credential_id, error = self._precheck_parts(
+            credential_id, timestamp, signature, method, url, body
+        )
+        if error is not None:
+            return error
+        assert credential_id is not None
 
-        # Verify credential
         return self.verify_credential(credential_id)
 
+    async def verify_requests_async(
+        self,
+        requests: Iterable[RequestParts],
+    ) -> list[VerificationResult]:
+        """
+        Verify several requests with AgentID headers (async).
 
-def check_permission(
-    permissions: list[str | Permission],
-    *,
-    resource: str,
-    action: str,
-    context: dict[str, Any] | None = None,
-) -> dict[str, Any]:
-    """
-    Check if permissions allow a specific action.
+        Headers and signatures are checked for each request first, then the
+        credentials of the requests that passed are looked up concurrently,
+        once per distinct credential.
 
-    Args:
-        permissions: List of permissions from credential
-        resource: The resource being accessed
-        action: The action being attempted
-        context: Optional context (time, region, amount, etc.)
+        Args:
+            requests: (headers, method, url, body) tuples
 
-    Returns:
-        Dict with 'granted' (bool) and 'reason' (str if denied)
-    """
-    import fnmatch
-
-    for perm in permissions:
-        # Handle string permissions (legacy)
-        if isinstance(perm, str):
-            if perm == "*" or perm == action:
-                return {"granted": True}
-            continue
-
-        # Handle structured permissions
-        if isinstance(perm, dict):
-            perm = Permission(**perm)
-
-        # Check resource match (supports wildcards)
-        if not fnmatch.fnmatch(resource, perm.resource):
-            continue
-
-        # Check action
-        if action not in perm.actions and "*" not in perm.actions:
-            continue
-
-        # Check conditions if present
-        if perm.conditions and context:
-            # Check time window
-            if perm.conditions.valid_hours:
-                # Would need actual time checking logic
-                pass
-
-            # Check rate limits
-            if perm.conditions.max_requests_per_minute:
-                # Would need rate tracking
-                pass
-
-            # Check amount limits
-            if perm.conditions.max_transaction_amount:
-                amount = context.get("amount")
-                if amount and amount > perm.conditions.max_transaction_amount:
-                    return {
-                        "granted": False,
-                        "reason": f"Amount {amount} exceeds limit {perm.conditions.max_transaction_amount}",
-                    }
-
-            # Check region
-            if perm.conditions.allowed_regions:
-                region = context.get("region")
-                if region and region not in perm.conditions.allowed_regions:
-                    return {
-                        "granted": False,
-                        "reason": f"Region {region} not allowed",
-                    }
-
-        # All checks passed
-        return {"granted": True}
-
-    # No matching permission found
-    return {
-        "granted": False,
-        "reason": f"No permission for {action} on {resource}",
-    }
+        Returns:
+            Verification results, in the same order as requests
+        """
+        checked = [self._precheck_request(*request) for request in requests]
+        credential_ids = [cid for cid, error in checked if error is None and cid is not None]
+        results = iter(await self.verify_credentials_async(credential_ids))
+        return [error if error is not None else next(results) for _, error in checked]
+
+    def verify_requests(
+        self,
+        requests: Iterable[RequestParts],
+    ) -> list[VerificationResult]:
+        """
+        Verify several requests with AgentID headers (sync).
+
+        Each distinct credential is looked up once.
+
+        Args:
+            requests: (headers, method, url, body) tuples
+
+        Returns:
+            Verification results, in the same order as requests
+        """
+        by_id: dict[str, VerificationResult] = {}
+        results = []
+        for request in requests:
+            credential_id, result = self._precheck_request(*request)
+            if result is None:
+                assert credential_id is not None
+                if credential_id not in by_id:
+                    by_id[credential_id] = self.verify_credential(credential_id)
+                result = by_id[credential_id]
+            results.append(result)
+        return results
 
 
 # Decorator for protecting functions
@@ -401,8 +838,6 @@ def require_credential(
             ...
     """
     def decorator(func: F) -> F:
-        import functools
-
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Would need request object from framework
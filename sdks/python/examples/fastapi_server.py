@@ -9,6 +9,7 @@ Run with: uvicorn fastapi_server:app --reload
 
 from fastapi import Depends, FastAPI, Request
 
+from agentid import PermissionIndex, check_permission
 from agentid.integrations.fastapi import (
     AgentIDConfig,
     AgentIDMiddleware,
@@ -20,7 +21,6 @@ from agentid.integrations.fastapi import (
     require_verified_issuer,
 )
 from agentid.types import CredentialPayload
-from agentid.verifier import check_permission
 
 # Create FastAPI app
 app = FastAPI(
@@ -183,18 +183,19 @@ async def create_transaction(
     body = await request.json()
     amount = body.get("amount", 0)
 
-    # Check permission with amount context
+    # Check permission with amount context. The credential's index is built
+    # once and reused for every request it makes.
     allowed = check_permission(
-        credential.permissions,
+        PermissionIndex.from_credential(credential),
         resource="/transactions",
         action="write",
         context={"amount": amount},
     )
 
-    if not allowed["granted"]:
+    if not allowed.granted:
         return {
             "error": "Permission denied",
-            "reason": allowed.get("reason"),
+            "reason": allowed.reason,
         }
 
     return {
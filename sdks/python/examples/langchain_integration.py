@@ -171,7 +171,7 @@ our_credential = AgentCredential("cred_agent_b")
 async def handle_task(request: Request):
     # Verify Agent A
     result = verifier.verify_request(
-        headers=dict(request.headers),
+        headers=request.headers,
         method="POST",
         url=str(request.url),
     )
@@ -5,7 +5,7 @@ This example shows how services can verify incoming requests
 from AI agents using AgentID credentials.
 """
 
-from agentid import CredentialVerifier, check_permission
+from agentid import CredentialVerifier, PermissionIndex, check_permission
 
 
 def verify_request_example():
@@ -91,16 +91,19 @@ def check_permissions_example():
         },
     ]
 
+    # Index the permissions once when checking many requests against them
+    index = PermissionIndex.build(permissions)
+
     for case in test_cases:
         result = check_permission(
-            permissions,
+            index,
             resource=case["resource"],
             action=case["action"],
             context=case["context"],
         )
 
-        status = "ALLOWED" if result["granted"] else "DENIED"
-        reason = result.get("reason", "")
+        status = "ALLOWED" if result.granted else "DENIED"
+        reason = result.reason or ""
 
         print(f"{case['action'].upper()} {case['resource']}")
         print(f"  Context: {case['context']}")
@@ -116,15 +119,17 @@ def fastapi_middleware_example():
 
     code = '''
 from fastapi import FastAPI, Request, HTTPException, Depends
-from agentid import CredentialVerifier, check_permission
+from agentid import CredentialVerifier, PermissionIndex, check_permission
 
 app = FastAPI()
 verifier = CredentialVerifier()
 
 async def verify_agent(request: Request):
     """Dependency to verify AgentID credentials."""
-    result = verifier.verify_request(
-        headers=dict(request.headers),
+    result = await verifier.verify_request_parts_async(
+        credential_id=request.headers.get("x-agentid-credential"),
+        timestamp=request.headers.get("x-agentid-timestamp"),
+        signature=request.headers.get("x-agentid-signature"),
         method=request.method,
         url=str(request.url),
         body=await request.body() if request.method in ["POST", "PUT", "PATCH"] else None,
@@ -158,15 +163,15 @@ async def create_user(request: Request, credential = Depends(verify_agent)):
     """Protected endpoint with permission check."""
     # Check if agent has write permission
     allowed = check_permission(
-        credential.credential.permissions,
+        PermissionIndex.from_credential(credential.credential),
         resource="https://your-api.com/users",
         action="write",
     )
 
-    if not allowed["granted"]:
+    if not allowed.granted:
         raise HTTPException(
             status_code=403,
-            detail={"error": "Permission denied", "reason": allowed["reason"]}
+            detail={"error": "Permission denied", "reason": allowed.reason}
         )
 
     body = await request.json()
@@ -1,6 +1,7 @@
 """Tests for credential caching."""
 
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -88,6 +89,63 @@ class TestCredentialCache:
         """Test deleting non-existent key."""
         assert cache.delete("nonexistent") is False
 
+    def test_delete_many(self, cache):
+        """Test deleting several keys at once."""
+        cache.set("key1", {"value": "1"})
+        cache.set("key2", {"value": "2"})
+        cache.set("key3", {"value": "3"})
+
+        assert cache.delete_many(["key1", "key2", "missing"]) == 2
+        assert cache.get("key1") is None
+        assert cache.get("key2") is None
+        assert cache.get("key3") is not None
+
+    def test_delete_many_locks_each_shard_once(self, cache):
+        """Test deleting many keys takes each shard's lock at most once."""
+        keys = [f"verify:cred_{i}" for i in range(100)]
+        for key in keys:
+            cache.set(key, "value")
+
+        acquired = []
+
+        class CountingLock:
+            def __init__(self, lock):
+                self.lock = lock
+
+            def __enter__(self):
+                acquired.append(self)
+                return self.lock.__enter__()
+
+            def __exit__(self, *args):
+                return self.lock.__exit__(*args)
+
+        cache._locks = [CountingLock(lock) for lock in cache._locks]
+
+        assert cache.delete_many(keys) == 100
+        assert len(acquired) == len(set(map(id, acquired)))
+        assert cache.size() == 0
+
+    def test_get_entry(self, cache):
+        """Test getting an entry with its timestamps."""
+        cache.set("key1", {"value": "1"}, ttl=60)
+
+        entry = cache.get_entry("key1")
+        assert entry.value == {"value": "1"}
+        assert entry.expires_at - entry.created_at == pytest.approx(60, abs=0.1)
+
+        cache.set("key2", {"value": "2"}, ttl=0.001)
+        time.sleep(0.01)
+        assert cache.get_entry("key2") is None
+        assert cache.get_entry("missing") is None
+
+    def test_expiry_ignores_wall_clock_changes(self, cache):
+        """Test entries don't expire when the system clock jumps forward."""
+        cache.set("key1", {"value": "1"}, ttl=60)
+
+        with patch("agentid.cache.time.time", return_value=time.time() + 3600):
+            assert cache.get("key1") == {"value": "1"}
+            assert cache.get_ttl("key1") > 59
+
     def test_clear(self, cache):
         """Test clearing the cache."""
         cache.set("key1", {"value": "1"})
@@ -110,6 +168,18 @@ class TestCredentialCache:
         assert cache.size() == 1
         assert cache.get("key3") is not None
 
+    def test_cleanup_expired_skips_overwritten_keys(self, cache):
+        """Test cleanup keeps keys re-set with a longer TTL."""
+        cache.set("key1", {"value": "old"}, ttl=0.001)
+        cache.set("key1", {"value": "new"}, ttl=100)
+        cache.set("key2", {"value": "2"}, ttl=0.001)
+        cache.delete("key2")
+
+        time.sleep(0.01)
+
+        assert cache.cleanup_expired() == 0
+        assert cache.get("key1") == {"value": "new"}
+
     def test_size(self, cache):
         """Test size method."""
         assert cache.size() == 0
@@ -138,6 +208,27 @@ class TestCredentialCache:
         time.sleep(0.01)
         assert cache.get_ttl("key1") is None
 
+    def test_reads_do_not_lock(self, cache):
+        """Test reads succeed while a writer holds the shard lock."""
+        cache.set("key1", "value1")
+        lock, _ = cache._shard("key1")
+
+        with lock:
+            assert cache.get("key1") == "value1"
+            assert cache.get_entry("key1").value == "value1"
+            assert cache.get_ttl("key1") > 0
+
+    def test_expired_read_keeps_replaced_entry(self, cache):
+        """Test evicting a stale read doesn't delete a newer value."""
+        cache.set("key1", "old", ttl=0)
+        _, shard = cache._shard("key1")
+        stale = shard["key1"]
+        cache.set("key1", "new")
+
+        lock, _ = cache._shard("key1")
+        cache._evict(lock, shard, "key1", stale)
+        assert cache.get("key1") == "new"
+
     def test_thread_safety(self, cache):
         """Test thread safety of cache operations."""
         import threading
@@ -1,5 +1,6 @@
 """Tests for AgentCredential class."""
 
+import asyncio
 import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
@@ -14,6 +15,7 @@ from agentid import (
     CredentialRevokedError,
 )
 from agentid.cache import CredentialCache
+from agentid.transport import _shared_async_clients, get_shared_async_client
 
 
 class TestAgentCredential:
@@ -125,7 +127,7 @@ class TestAgentCredentialWithMockedAPI:
 
     def test_load_success(self, mock_response_data):
         """Test successful credential loading."""
-        with patch("httpx.post") as mock_post:
+        with patch("httpx.Client.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.is_success = True
@@ -141,7 +143,7 @@ class TestAgentCredentialWithMockedAPI:
 
     def test_load_not_found(self):
         """Test loading non-existent credential."""
-        with patch("httpx.post") as mock_post:
+        with patch("httpx.Client.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.is_success = True
@@ -159,7 +161,7 @@ class TestAgentCredentialWithMockedAPI:
 
     def test_load_expired(self):
         """Test loading expired credential."""
-        with patch("httpx.post") as mock_post:
+        with patch("httpx.Client.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.is_success = True
@@ -177,7 +179,7 @@ class TestAgentCredentialWithMockedAPI:
 
     def test_load_revoked(self):
         """Test loading revoked credential."""
-        with patch("httpx.post") as mock_post:
+        with patch("httpx.Client.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.is_success = True
@@ -197,7 +199,7 @@ class TestAgentCredentialWithMockedAPI:
         """Test that loading uses cache."""
         cache = CredentialCache()
 
-        with patch("httpx.post") as mock_post:
+        with patch("httpx.Client.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.is_success = True
@@ -219,7 +221,7 @@ class TestAgentCredentialWithMockedAPI:
         """Test that force=True bypasses cache."""
         cache = CredentialCache()
 
-        with patch("httpx.post") as mock_post:
+        with patch("httpx.Client.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.is_success = True
@@ -282,3 +284,43 @@ class TestAgentCredentialAsync:
             # This would work with proper async mocking
             # result = await cred.load_async()
             # assert result.agent_name == "Test Agent"
+
+    @pytest.mark.asyncio
+    async def test_load_async_reuses_client(self):
+        """Test async loads share one pooled client per event loop."""
+        mock_data = {
+            "valid": True,
+            "credential": {
+                "credential_id": "cred_test",
+                "agent_id": "agent_123",
+                "agent_name": "Test Agent",
+                "issuer": {
+                    "issuer_id": "issuer_123",
+                    "name": "Test Issuer",
+                },
+                "permissions": [],
+                "constraints": {
+                    "valid_from": datetime.now(timezone.utc).isoformat(),
+                    "valid_until": (datetime.now(timezone.utc) + timedelta(days=30)).isoformat(),
+                },
+                "signature": "sig",
+            },
+            "trust_score": 80,
+        }
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=mock_data)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        _shared_async_clients[asyncio.get_running_loop()] = client
+
+        for _ in range(2):
+            cred = AgentCredential("cred_test", cache=CredentialCache())
+            result = await cred.load_async()
+            assert result.agent_name == "Test Agent"
+
+        assert len(requests) == 2
+        assert get_shared_async_client() is client
+        await client.aclose()
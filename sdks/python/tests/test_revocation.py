@@ -0,0 +1,67 @@
+"""Tests for revocation subscription."""
+
+from unittest.mock import patch
+
+import httpx
+
+from agentid.cache import CredentialCache
+from agentid.revocation import RevocationSubscriber
+
+
+class TestRevocationPolling:
+    """Tests for polling revocations."""
+
+    def test_malformed_entry_does_not_block_others(self):
+        """Test one bad entry doesn't stop the rest being applied."""
+        cache = CredentialCache()
+        cache.set("verify:cred_good", {"valid": True})
+        errors = []
+        subscriber = RevocationSubscriber(cache=cache, on_error=errors.append)
+
+        response = httpx.Response(
+            200,
+            json={
+                "revocations": [
+                    {"credential_id": "cred_good", "revoked_at": "2024-01-01T00:00:00Z"},
+                    {"credential_id": 123},
+                ]
+            },
+        )
+        with patch("httpx.get", return_value=response):
+            events = subscriber.check_revocations_sync()
+
+        assert [event.credential_id for event in events] == ["cred_good"]
+        assert cache.get("verify:cred_good") is None
+        assert subscriber.is_revoked("cred_good")
+        assert subscriber._last_revocation_check > 0
+        assert len(errors) == 1
+
+    async def test_malformed_batch_entry_does_not_block_others(self):
+        """Test one bad entry in a WebSocket batch doesn't drop the batch."""
+        cache = CredentialCache()
+        cache.set("verify:cred_good", {"valid": True})
+        errors = []
+        subscriber = RevocationSubscriber(cache=cache, on_error=errors.append)
+
+        message = (
+            '{"type": "revocations_batch", "data": ['
+            '{"credential_id": "cred_good", "revoked_at": "2024-01-01T00:00:00Z"},'
+            '{"revoked_at": "2024-01-01T00:00:00Z"}]}'
+        )
+        await subscriber._handle_ws_message(None, message)
+
+        assert cache.get("verify:cred_good") is None
+        assert subscriber.is_revoked("cred_good")
+        assert len(errors) == 1
+
+    async def test_malformed_message_is_reported(self):
+        """Test a malformed single revocation is reported like a bad batch entry."""
+        errors = []
+        subscriber = RevocationSubscriber(cache=CredentialCache(), on_error=errors.append)
+
+        await subscriber._handle_ws_message(None, '{"type": "revocation", "data": {}}')
+        assert len(errors) == 1
+
+        # Message types we don't handle are ignored
+        await subscriber._handle_ws_message(None, '{"type": "welcome"}')
+        assert len(errors) == 1
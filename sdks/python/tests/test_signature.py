@@ -1,15 +1,22 @@
 """Tests for signature utilities."""
 
+import dataclasses
+import enum
+import json
 import time
+import uuid
+from datetime import date, datetime
 
 import pytest
 
 from agentid.signature import (
+    BLAKE3_AVAILABLE,
     RequestSigner,
     canonical_json,
     generate_nonce,
     generate_request_signature,
     verify_request_signature,
+    verify_request_signatures_batch,
 )
 from agentid.exceptions import SignatureError
 
@@ -42,6 +49,65 @@ class TestCanonicalJson:
         assert " " not in result
         assert "\n" not in result
 
+    def test_matches_json_dumps(self):
+        """Test output is identical to json.dumps, whichever encoder is used."""
+        objects = [
+            {"name": "caf\u00e9", "emoji": "\U0001f600", "ctrl": "\x00\x1f\x7f\t"},
+            {"floats": [0.1, 1.5, 1e-7, 1e16, 4.3e-05, -0.0], "none": None},
+            {"big": 2**70, "small": -(2**63), "flags": [True, False]},
+            {"path": "/a/b", "quote": 'say "hi"', "backslash": "a\\b"},
+            [{"b": 1, "a": {"d": [], "c": {}}}],
+            {"none": None, "items": [None, 0, "null"]},
+        ]
+
+        for obj in objects:
+            assert canonical_json(obj) == json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+    def test_rejects_what_json_dumps_rejects(self):
+        """Test types only orjson can encode raise, whichever encoder is installed."""
+
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        for value in (
+            Point(1),
+            datetime(2024, 1, 1),
+            date(2024, 1, 1),
+            uuid.UUID(int=1),
+            Color.RED,
+            [{"id": uuid.UUID(int=1)}],
+        ):
+            with pytest.raises(TypeError):
+                canonical_json({"value": value})
+
+    def test_str_subclasses_match_json_dumps(self):
+        """Test str and int enums are encoded by value, as json.dumps does."""
+
+        class Role(str, enum.Enum):
+            ADMIN = "admin"
+
+        class Level(enum.IntEnum):
+            HIGH = 2
+
+        obj = {"role": Role.ADMIN, "level": Level.HIGH}
+        assert canonical_json(obj) == json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+
+    def test_circular_reference_raises(self):
+        """Test self-referencing containers raise like json.dumps instead of hanging."""
+        items: list = []
+        items.append(items)
+        mapping: dict = {}
+        mapping["self"] = mapping
+
+        for obj in (items, {"items": items}, mapping):
+            with pytest.raises(ValueError, match="Circular reference"):
+                canonical_json(obj)
+
 
 class TestGenerateRequestSignature:
     """Tests for request signature generation."""
@@ -140,6 +206,61 @@ class TestGenerateRequestSignature:
         assert sig1 == sig2
 
 
+@pytest.mark.skipif(not BLAKE3_AVAILABLE, reason="blake3 not installed")
+class TestBlake3Signature:
+    """Tests for BLAKE3 request signatures."""
+
+    kwargs = {
+        "method": "POST",
+        "url": "https://api.example.com/data",
+        "body": '{"key": "value"}',
+        "timestamp": 1234567890,
+        "credential_id": "cred_test",
+        "secret": "secret",
+    }
+
+    def test_tagged_signature(self):
+        """Test BLAKE3 signatures are tagged and differ from SHA-256 ones."""
+        sig = generate_request_signature(**self.kwargs, algorithm="blake3")
+        assert sig.startswith("b3$")
+        assert sig != generate_request_signature(**self.kwargs)
+        assert sig == generate_request_signature(**self.kwargs, algorithm="blake3")
+
+    def test_different_inputs_different_signatures(self):
+        """Test that each signed field changes the signature."""
+        sig = generate_request_signature(**self.kwargs, algorithm="blake3")
+        for field, value in [
+            ("method", "GET"),
+            ("url", "https://api.example.com/other"),
+            ("body", '{"key": "other"}'),
+            ("secret", "other"),
+        ]:
+            changed = {**self.kwargs, field: value}
+            assert generate_request_signature(**changed, algorithm="blake3") != sig
+
+    def test_verify(self):
+        """Test BLAKE3 signatures verify, and not under another secret."""
+        ts = int(time.time())
+        kwargs = {**self.kwargs, "timestamp": ts}
+        sig = generate_request_signature(**kwargs, algorithm="blake3")
+
+        assert verify_request_signature(signature=sig, **kwargs) is True
+        assert verify_request_signature(signature=sig, **{**kwargs, "secret": "wrong"}) is False
+        assert verify_request_signature(signature=sig[3:], **kwargs) is False
+
+    def test_signer(self):
+        """Test RequestSigner signs with BLAKE3 and verifies in batch."""
+        signer = RequestSigner("cred_test", "secret", algorithm="blake3")
+        headers = signer.sign_request("GET", "https://api.example.com/data")
+        sig = headers["X-AgentID-Signature"]
+        ts = int(headers["X-AgentID-Timestamp"])
+
+        assert sig.startswith("b3$")
+        assert signer.verify_batch([(sig, "GET", "https://api.example.com/data", None, ts)]) == [
+            True
+        ]
+
+
 class TestVerifyRequestSignature:
     """Tests for request signature verification."""
 
@@ -183,6 +304,21 @@ class TestVerifyRequestSignature:
         )
         assert result is False
 
+    def test_reject_malformed_signature(self):
+        """Test rejecting signatures that are not a base64 SHA-256 digest."""
+        timestamp = int(time.time())
+        kwargs = {
+            "method": "GET",
+            "url": "https://api.example.com/data",
+            "body": None,
+            "timestamp": timestamp,
+            "credential_id": "cred_test",
+            "secret": "secret",
+        }
+
+        assert verify_request_signature(signature="not base64!", **kwargs) is False
+        assert verify_request_signature(signature="c2hvcnQ=", **kwargs) is False
+
     def test_reject_old_timestamp(self):
         """Test rejecting old timestamps."""
         old_timestamp = int(time.time()) - 600  # 10 minutes ago
@@ -199,6 +335,44 @@ class TestVerifyRequestSignature:
                 max_age_seconds=300,
             )
 
+    def test_verify_batch(self):
+        """Test verifying several signatures in one call."""
+        now = int(time.time())
+
+        def item(url, body, timestamp=now, signed_body=None):
+            sig = generate_request_signature(
+                method="POST",
+                url=url,
+                body=body if signed_body is None else signed_body,
+                timestamp=timestamp,
+                credential_id="cred_test",
+                secret="secret",
+            )
+            return (sig, "POST", url, body, timestamp, "cred_test")
+
+        items = [
+            item("https://api.example.com/1", "x"),
+            item("https://api.example.com/2", None),
+            item("https://api.example.com/3", "y", signed_body="x"),
+            item("https://api.example.com/4", "x", timestamp=now - 600),
+            ("not base64!", "POST", "https://api.example.com/5", None, now, "cred_test"),
+        ]
+
+        results = verify_request_signatures_batch(items, "secret")
+
+        assert results == [True, True, False, False, False]
+        assert verify_request_signatures_batch(items[:1], "other") == [False]
+        for (sig, method, url, body, timestamp, cred), expected in zip(items[:3], results):
+            assert verify_request_signature(
+                signature=sig,
+                method=method,
+                url=url,
+                body=body,
+                timestamp=timestamp,
+                credential_id=cred,
+                secret="secret",
+            ) is expected
+
 
 class TestGenerateNonce:
     """Tests for nonce generation."""
@@ -250,3 +424,33 @@ class TestRequestSigner:
         headers = signer.sign_request("GET", "https://api.example.com/data")
 
         assert "X-AgentID-Signature" in headers
+
+    def test_sign_request_matches_generate(self):
+        """Test repeated signing matches one-off signature generation."""
+        signer = RequestSigner("cred_test", signing_secret="secret")
+        for body in (None, '{"key": "value"}'):
+            headers = signer.sign_request("POST", "https://api.example.com/data", body)
+            expected = generate_request_signature(
+                method="POST",
+                url="https://api.example.com/data",
+                body=body,
+                timestamp=int(headers["X-AgentID-Timestamp"]),
+                credential_id="cred_test",
+                secret="secret",
+            )
+            assert headers["X-AgentID-Signature"] == expected
+
+    def test_verify_batch_round_trip(self):
+        """Test a signer verifies its own signatures in a batch."""
+        for secret in ("secret", None):
+            signer = RequestSigner("cred_test", signing_secret=secret)
+            headers = signer.sign_request("POST", "https://api.example.com/data", body="hi")
+            item = (
+                headers["X-AgentID-Signature"],
+                "POST",
+                "https://api.example.com/data",
+                "hi",
+                int(headers["X-AgentID-Timestamp"]),
+            )
+
+            assert signer.verify_batch([item, (*item[:3], "bye", item[4])]) == [True, False]
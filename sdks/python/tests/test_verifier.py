@@ -1,13 +1,35 @@
 """Tests for credential verification."""
 
+import asyncio
+import fnmatch
+import ssl
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+from pydantic import ValidationError
 
-from agentid import CredentialVerifier
-from agentid.verifier import check_permission
-from agentid.types import Permission
+from agentid import AgentIDError, CredentialVerifier, NetworkError
+from agentid._permissions import PermissionIndex, check_permission
+from agentid.cache import CredentialCache
+from agentid.signature import RequestSigner
+from agentid.transport import (
+    HTTP2_AVAILABLE,
+    HttpxTransport,
+    TransportResponse,
+    get_ssl_context,
+)
+from agentid.types import CredentialPayload, Permission, VerificationResult
+
+
+def mock_verifier(handler, cache=None, **kwargs):
+    """Create a verifier whose API calls are answered by a request handler."""
+    mock = httpx.MockTransport(handler)
+    transport = HttpxTransport(transport=mock, async_transport=mock)
+    return CredentialVerifier(cache=cache or CredentialCache(), transport=transport, **kwargs)
 
 
 class TestCredentialVerifier:
@@ -36,6 +58,134 @@ class TestCredentialVerifier:
         assert verifier.cache_ttl == 600.0
         assert verifier.verify_signature is False
 
+    def test_http_client_is_pooled(self, verifier):
+        """Test the sync HTTP client is reused until closed."""
+        client = verifier.transport._get_sync_client()
+        assert verifier.transport._get_sync_client() is client
+
+        verifier.close()
+        assert client.is_closed
+        assert verifier.transport._get_sync_client() is not client
+        verifier.close()
+
+    def test_async_client_per_event_loop(self):
+        """Test async calls work from successive event loops, e.g. asyncio.run."""
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep connections alive
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                body = b'{"valid": false, "error_code": "CREDENTIAL_NOT_FOUND"}'
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        verifier = CredentialVerifier(
+            api_base=f"http://127.0.0.1:{server.server_port}", cache=CredentialCache()
+        )
+
+        clients = []
+
+        async def verify(credential_id):
+            result = await verifier.verify_credential_async(credential_id)
+            clients.append(verifier.transport._get_async_client())
+            return result
+
+        try:
+            for credential_id in ("cred_a", "cred_b"):
+                result = asyncio.run(verify(credential_id))
+                assert result.error_code == "CREDENTIAL_NOT_FOUND"
+
+            # Each loop's client is closed when asyncio.run shuts the loop down
+            assert clients[0] is not clients[1]
+            assert all(client.is_closed for client in clients)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_sync_client_closed_with_transport(self):
+        """Test a transport's sync client is closed once the transport is collected."""
+        import gc
+
+        transport = HttpxTransport(transport=httpx.MockTransport(lambda request: None))
+        client = transport._get_sync_client()
+
+        del transport
+        gc.collect()
+        assert client.is_closed
+
+    def test_http2_follows_h2_availability(self):
+        """Test HTTP/2 is used by default only when h2 is installed."""
+        assert HttpxTransport().http2 is HTTP2_AVAILABLE
+        assert HttpxTransport(http2=False).http2 is False
+
+        if not HTTP2_AVAILABLE:
+            with pytest.raises(ImportError, match="agentid\\[http2\\]"):
+                HttpxTransport(http2=True)
+
+    def test_httpx_transport_request(self):
+        """Test the httpx transport posts compact JSON to the API path."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        transport = HttpxTransport(
+            "https://custom.api.com/api/", transport=httpx.MockTransport(handler)
+        )
+
+        response = transport.post_json("/verify", {"credential_id": "cred_123"})
+
+        assert response.status_code == 200
+        assert str(requests[0].url) == "https://custom.api.com/api/verify"
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert requests[0].content == b'{"credential_id":"cred_123"}'
+        transport.close()
+
+    def test_ssl_context_is_shared(self):
+        """Test TLS contexts are built once and still verify certificates."""
+        context = get_ssl_context()
+
+        assert get_ssl_context() is context
+        assert context.verify_mode == ssl.CERT_REQUIRED
+        assert context.check_hostname is True
+
+    def test_ssl_context_honors_cert_env(self, monkeypatch, tmp_path):
+        """Test SSL_CERT_FILE is used for the CA bundle, as httpx does."""
+        monkeypatch.setenv("SSL_CERT_FILE", str(tmp_path / "missing.pem"))
+
+        with pytest.raises(FileNotFoundError):
+            get_ssl_context.__wrapped__()
+
+    def test_custom_transport(self):
+        """Test API calls go through the configured transport."""
+
+        class FakeTransport:
+            def __init__(self):
+                self.calls = []
+
+            def post_json(self, path, body):
+                self.calls.append((path, body))
+                return TransportResponse(
+                    200, {}, b'{"valid": false, "error_code": "CREDENTIAL_NOT_FOUND"}'
+                )
+
+        transport = FakeTransport()
+        verifier = CredentialVerifier(cache=CredentialCache(), transport=transport)
+
+        result = verifier.verify_credential("cred_123")
+
+        assert transport.calls == [("/verify", {"credential_id": "cred_123"})]
+        assert result.error_code == "CREDENTIAL_NOT_FOUND"
+
     def test_extract_credential_info(self, verifier):
         """Test header extraction."""
         headers = {
@@ -65,6 +215,55 @@ class TestCredentialVerifier:
         assert cred_id == "cred_123"
         assert timestamp == "1234567890"
 
+    def test_extract_credential_info_mixed_case(self, verifier):
+        """Test header extraction with non-canonical casing."""
+        headers = {"X-AGENTID-CREDENTIAL": "cred_123", "x-AgentId-Nonce": "abc123"}
+
+        cred_id, timestamp, nonce, signature = verifier._extract_credential_info(headers)
+
+        assert cred_id == "cred_123"
+        assert timestamp is None
+        assert nonce == "abc123"
+        assert signature is None
+
+    def test_extract_credential_info_mixed_spellings(self, verifier):
+        """Test headers spelled differently from each other are all found."""
+        headers = {
+            "X-AgentID-Credential": "cred_123",
+            "x-agentid-timestamp": "1234567890",
+            "X-AGENTID-SIGNATURE": "sig_xyz",
+        }
+
+        assert verifier._extract_credential_info(headers) == (
+            "cred_123",
+            "1234567890",
+            None,
+            "sig_xyz",
+        )
+
+    def test_extract_credential_info_ignores_similar_headers(self, verifier):
+        """Test headers sharing the AgentID prefix aren't mistaken for ours."""
+        headers = {
+            "X-AgentID-Capabilities": "read",
+            "X-AgentID-Signature-Version": "2",
+            "X-AgentID-Credential": "cred_123",
+        }
+
+        cred_id, timestamp, nonce, signature = verifier._extract_credential_info(headers)
+
+        assert cred_id == "cred_123"
+        assert signature is None
+
+    def test_extract_credential_info_httpx_headers(self, verifier):
+        """Test header extraction from case-insensitive header objects."""
+        headers = httpx.Headers({"X-AgentID-Credential": "cred_123", "X-AgentID-Nonce": "n"})
+
+        cred_id, timestamp, nonce, signature = verifier._extract_credential_info(headers)
+
+        assert cred_id == "cred_123"
+        assert timestamp is None
+        assert nonce == "n"
+
     def test_verify_request_missing_credential(self, verifier):
         """Test verification fails with missing credential header."""
         result = verifier.verify_request(
@@ -76,6 +275,15 @@ class TestCredentialVerifier:
         assert result.valid is False
         assert result.error_code == "MISSING_CREDENTIAL"
 
+    def test_verify_request_error_results_are_shared(self, verifier):
+        """Test malformed requests reuse the same frozen result."""
+        first = verifier.verify_request(headers={}, method="GET", url="https://x")
+        second = verifier.verify_request(headers={}, method="GET", url="https://x")
+
+        assert first is second
+        with pytest.raises(ValidationError):
+            first.valid = True
+
     def test_verify_request_missing_signature(self, verifier):
         """Test verification fails with missing signature headers."""
         result = verifier.verify_request(
@@ -120,6 +328,420 @@ class TestCredentialVerifier:
         assert result.error_code == "INVALID_TIMESTAMP"
 
 
+    def test_verify_request_non_ascii_digit_timestamp(self, verifier):
+        """Test timestamps with non-ASCII digits are rejected."""
+        result = verifier.verify_request(
+            headers={
+                "X-AgentID-Credential": "cred_123",
+                "X-AgentID-Timestamp": "\u00b2\u00b3",
+                "X-AgentID-Signature": "sig_abc",
+            },
+            method="GET",
+            url="https://api.example.com/data",
+        )
+
+        assert result.valid is False
+        assert result.error_code == "INVALID_TIMESTAMP"
+
+    def test_verify_request_oversized_timestamp(self, verifier):
+        """Test huge numeric timestamps are rejected rather than parsed."""
+        result = verifier.verify_request(
+            headers={
+                "X-AgentID-Credential": "cred_123",
+                "X-AgentID-Timestamp": "9" * 5000,
+                "X-AgentID-Signature": "sig_abc",
+            },
+            method="GET",
+            url="https://api.example.com/data",
+        )
+
+        assert result.error_code == "INVALID_TIMESTAMP"
+
+    def test_verify_request_future_timestamp(self, verifier):
+        """Test timestamps too far in the future are rejected."""
+        future_timestamp = str(int(time.time()) + 600)
+
+        result = verifier.verify_request(
+            headers={
+                "X-AgentID-Credential": "cred_123",
+                "X-AgentID-Timestamp": future_timestamp,
+                "X-AgentID-Signature": "sig_abc",
+            },
+            method="GET",
+            url="https://api.example.com/data",
+        )
+
+        assert result.valid is False
+        assert result.error_code == "SIGNATURE_EXPIRED"
+
+
+class TestCredentialLookupCoalescing:
+    """Tests for sharing in-flight credential lookups."""
+
+    NOT_FOUND = {"valid": False, "error": "Not found", "error_code": "CREDENTIAL_NOT_FOUND"}
+
+    async def test_concurrent_async_lookups_share_request(self):
+        """Test concurrent async lookups for one credential make one API call."""
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=self.NOT_FOUND)
+
+        verifier = mock_verifier(handler)
+
+        results = await asyncio.gather(
+            *(verifier.verify_credential_async("cred_123") for _ in range(5))
+        )
+
+        assert len(calls) == 1
+        assert all(r.error_code == "CREDENTIAL_NOT_FOUND" for r in results)
+        assert verifier._inflight == {}
+        await verifier.aclose()
+
+    async def test_verify_credentials_async_dedupes(self):
+        """Test batch verification looks up each credential once, in order."""
+        calls = []
+
+        async def handler(request):
+            credential_id = request.read().decode()
+            calls.append(credential_id)
+            return httpx.Response(200, json={**self.NOT_FOUND, "error": credential_id})
+
+        verifier = mock_verifier(handler)
+
+        results = await verifier.verify_credentials_async(["cred_a", "cred_b", "cred_a"])
+
+        assert len(calls) == 2
+        assert ["cred_a" in r.error for r in results] == [True, False, True]
+        await verifier.aclose()
+
+    def test_concurrent_sync_lookups_share_request(self):
+        """Test concurrent threads looking up one credential make one API call."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            time.sleep(0.1)
+            return httpx.Response(200, json=self.NOT_FOUND)
+
+        verifier = mock_verifier(handler)
+
+        barrier = threading.Barrier(4)
+        results = []
+
+        def lookup():
+            barrier.wait()
+            results.append(verifier.verify_credential("cred_123"))
+
+        threads = [threading.Thread(target=lookup) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len(results) == 4
+        verifier.close()
+
+
+class TestVerificationCache:
+    """Tests for caching verification results."""
+
+    VALID = {
+        "valid": True,
+        "credential": {
+            "credential_id": "cred_123",
+            "agent_id": "agent_123",
+            "agent_name": "Test Agent",
+            "issuer": {"issuer_id": "issuer_123", "name": "Test Issuer"},
+            "permissions": ["read"],
+            "constraints": {
+                "valid_from": "2024-01-01T00:00:00Z",
+                "valid_until": "2099-01-01T00:00:00Z",
+            },
+            "signature": "sig",
+        },
+        "trust_score": 80,
+    }
+
+    def test_cache_hit_returns_cached_result(self):
+        """Test a cache hit returns the stored result without an API call."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json=self.VALID)
+
+        verifier = mock_verifier(handler)
+
+        first = verifier.verify_credential("cred_123")
+        second = verifier.verify_credential("cred_123")
+
+        assert len(calls) == 1
+        assert second is first
+        assert second.credential.agent_name == "Test Agent"
+        verifier.close()
+
+    def test_negative_results_cached_briefly(self):
+        """Test stable failures are cached with the shorter TTL."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(
+                200, json={"valid": False, "error_code": "CREDENTIAL_NOT_FOUND"}
+            )
+
+        cache = CredentialCache()
+        verifier = mock_verifier(handler, cache=cache, negative_cache_ttl=10.0)
+
+        verifier.verify_credential("cred_missing")
+        verifier.verify_credential("cred_missing")
+
+        assert len(calls) == 1
+        assert cache.get_ttl("verify:cred_missing") <= 10.0
+
+        assert verifier.invalidate("cred_missing") is True
+        verifier.verify_credential("cred_missing")
+        assert len(calls) == 2
+        verifier.close()
+
+    def test_transient_failures_not_cached(self):
+        """Test failures that may change on retry are not cached."""
+        cache = CredentialCache()
+        verifier = mock_verifier(
+            lambda request: httpx.Response(
+                200, json={"valid": False, "error_code": "INTERNAL_ERROR"}
+            ),
+            cache=cache,
+        )
+
+        verifier.verify_credential("cred_123")
+
+        assert cache.get("verify:cred_123") is None
+        verifier.close()
+
+    async def test_early_refresh_near_expiry(self):
+        """Test a hit due for refresh returns the cached result and refreshes it."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json=self.VALID)
+
+        cache = CredentialCache()
+        verifier = mock_verifier(handler, cache=cache)
+        stale = VerificationResult.model_validate(self.VALID)
+        cache.set("verify:cred_123", stale, ttl=300)
+
+        # A typical draw on a fresh entry doesn't refresh it
+        with patch("agentid.verifier.random.random", return_value=0.5):
+            assert await verifier.verify_credential_async("cred_123") is stale
+        await asyncio.sleep(0.05)
+        assert calls == []
+
+        # An unlikely draw (as if the entry were about to expire) does
+        with patch("agentid.verifier.random.random", return_value=0.99999):
+            result = await verifier.verify_credential_async("cred_123")
+        assert result is stale
+        await asyncio.sleep(0.05)
+        assert len(calls) == 1
+        assert cache.get("verify:cred_123") is not stale
+        assert cache.get_ttl("verify:cred_123") > 250
+        await verifier.aclose()
+
+    def test_invalid_response_raises(self):
+        """Test malformed API responses raise AgentIDError and aren't cached."""
+        cache = CredentialCache()
+        verifier = mock_verifier(
+            lambda request: httpx.Response(200, content=b"<html>oops</html>"), cache=cache
+        )
+
+        with pytest.raises(AgentIDError, match="Invalid response"):
+            verifier.verify_credential("cred_123")
+
+        assert cache.get("verify:cred_123") is None
+        verifier.close()
+
+    def test_cache_hit_accepts_plain_data(self):
+        """Test cached dicts are still turned into results."""
+        cache = CredentialCache()
+        cache.set("verify:cred_123", self.VALID)
+
+        result = CredentialVerifier(cache=cache).verify_credential("cred_123")
+
+        assert result.valid is True
+        assert result.credential.agent_id == "agent_123"
+
+
+class TestRequestSignatureCheck:
+    """Tests for checking request HMAC signatures."""
+
+    URL = "https://api.example.com/data"
+
+    @pytest.fixture
+    def verifier(self):
+        """Create a verifier with a signing secret and a cached credential."""
+        cache = CredentialCache()
+        cache.set("verify:cred_123", TestVerificationCache.VALID)
+        return CredentialVerifier(cache=cache, signing_secret="secret")
+
+    def test_valid_signature_is_remembered(self, verifier):
+        """Test a valid signature passes, and repeats skip the HMAC."""
+        headers = RequestSigner("cred_123", signing_secret="secret").sign_request(
+            "POST", self.URL, body="hello"
+        )
+
+        assert verifier.verify_request(headers, "POST", self.URL, "hello").valid is True
+
+        with patch("agentid.verifier._compute_signature") as verify:
+            result = verifier.verify_request(headers, "POST", self.URL, "hello")
+        assert result.valid is True
+        verify.assert_not_called()
+
+        # The remembered signature doesn't cover other requests
+        result = verifier.verify_request(headers, "POST", self.URL, "tampered")
+        assert result.error_code == "INVALID_SIGNATURE"
+
+    def test_signature_check_reuses_keyed_hmac(self, verifier):
+        """Test signature checks copy the verifier's keyed HMAC instead of re-keying."""
+        headers = RequestSigner("cred_123", signing_secret="secret").sign_request("GET", self.URL)
+
+        with patch("agentid.signature.hmac.digest") as digest:
+            assert verifier.verify_request(headers, "GET", self.URL).valid is True
+        digest.assert_not_called()
+
+    def test_malformed_signature_rejected_before_hashing(self, verifier):
+        """Test signatures of the wrong length are rejected without any hashing."""
+        headers = RequestSigner("cred_123", signing_secret="secret").sign_request("GET", self.URL)
+
+        for signature in ("short", headers["X-AgentID-Signature"] + "A"):
+            with patch("agentid.verifier._signature_cache_key") as cache_key, patch(
+                "agentid.verifier._compute_signature"
+            ) as verify:
+                result = verifier.verify_request(
+                    {**headers, "X-AgentID-Signature": signature}, "GET", self.URL
+                )
+            assert result.error_code == "INVALID_SIGNATURE"
+            cache_key.assert_not_called()
+            verify.assert_not_called()
+
+    def test_verify_request_cache_hit(self):
+        """Test a repeated request needs neither the API nor the HMAC, until revoked."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) > 1:
+                raise httpx.ConnectError("API unavailable")
+            return httpx.Response(200, json=TestVerificationCache.VALID)
+
+        verifier = mock_verifier(handler, signing_secret="secret")
+        headers = RequestSigner("cred_123", signing_secret="secret").sign_request("GET", self.URL)
+
+        assert verifier.verify_request(headers, "GET", self.URL).valid is True
+        with patch("agentid.verifier._compute_signature") as verify:
+            assert verifier.verify_request(headers, "GET", self.URL).valid is True
+        verify.assert_not_called()
+        assert len(calls) == 1
+
+        # Revocation drops the cached credential, so the next request re-fetches
+        verifier.invalidate("cred_123")
+        with pytest.raises(NetworkError):
+            verifier.verify_request(headers, "GET", self.URL)
+        verifier.close()
+
+    async def test_invalid_signature_rejected_async(self, verifier):
+        """Test signatures made with another secret are rejected."""
+        headers = RequestSigner("cred_123", signing_secret="wrong").sign_request(
+            "GET", self.URL
+        )
+
+        result = await verifier.verify_request_async(headers, "GET", self.URL)
+
+        assert result.valid is False
+        assert result.error_code == "INVALID_SIGNATURE"
+
+    async def test_verify_request_parts(self, verifier):
+        """Test verifying from header values matches verifying from headers."""
+        headers = RequestSigner("cred_123", signing_secret="secret").sign_request(
+            "POST", self.URL, body="hello"
+        )
+        parts = (
+            headers["X-AgentID-Credential"],
+            headers["X-AgentID-Timestamp"],
+            headers["X-AgentID-Signature"],
+        )
+
+        assert verifier.verify_request_parts(*parts, "POST", self.URL, "hello").valid is True
+        result = await verifier.verify_request_parts_async(*parts, "POST", self.URL, "tampered")
+        assert result.error_code == "INVALID_SIGNATURE"
+
+        result = await verifier.verify_request_parts_async(None, None, None, "GET", self.URL)
+        assert result.error_code == "MISSING_CREDENTIAL"
+
+
+class TestVerifyRequests:
+    """Tests for verifying batches of requests."""
+
+    def requests(self):
+        """A batch with a bad request, a stale one and a duplicated credential."""
+        now = str(int(time.time()))
+        signed = {"X-AgentID-Timestamp": now, "X-AgentID-Signature": "sig"}
+        return [
+            ({"X-AgentID-Credential": "cred_a", **signed}, "GET", "https://a.example", None),
+            ({}, "GET", "https://a.example", None),
+            (
+                {"X-AgentID-Credential": "cred_b", **signed, "X-AgentID-Timestamp": "1"},
+                "GET",
+                "https://a.example",
+                None,
+            ),
+            ({"X-AgentID-Credential": "cred_c", **signed}, "GET", "https://a.example", None),
+            ({"X-AgentID-Credential": "cred_a", **signed}, "GET", "https://a.example", None),
+        ]
+
+    @staticmethod
+    def handler(calls):
+        def handle(request):
+            credential_id = request.read().decode()
+            calls.append(credential_id)
+            return httpx.Response(
+                200, json={"valid": False, "error": credential_id, "error_code": "X"}
+            )
+
+        return handle
+
+    async def test_verify_requests_async(self):
+        """Test each distinct credential that passed local checks is looked up once."""
+        calls = []
+        verifier = mock_verifier(self.handler(calls))
+
+        results = await verifier.verify_requests_async(self.requests())
+
+        assert len(calls) == 2
+        assert "cred_a" in results[0].error
+        assert results[1].error_code == "MISSING_CREDENTIAL"
+        assert results[2].error_code == "SIGNATURE_EXPIRED"
+        assert "cred_c" in results[3].error
+        assert results[4] is results[0]
+        await verifier.aclose()
+
+    def test_verify_requests(self):
+        """Test the sync batch gives the same results."""
+        calls = []
+        verifier = mock_verifier(self.handler(calls))
+
+        results = verifier.verify_requests(self.requests())
+
+        assert len(calls) == 2
+        assert [r.error_code for r in results[1:3]] == ["MISSING_CREDENTIAL", "SIGNATURE_EXPIRED"]
+        assert results[4] is results[0]
+        verifier.close()
+
+
 class TestCheckPermission:
     """Tests for permission checking."""
 
@@ -156,6 +778,68 @@ class TestCheckPermission:
         )
         assert result["granted"] is True
 
+    def test_wildcard_permission_short_circuits(self):
+        """Test grant-all permissions skip matching and conditions."""
+
+        class NoContext(dict):
+            def get(self, *args):
+                raise AssertionError("context read")
+
+        conditioned = {
+            "resource": "payments/*",
+            "actions": ["pay"],
+            "conditions": {"max_transaction_amount": 100},
+        }
+        for permissions in (
+            ["read", "*", conditioned],
+            [{"resource": "*", "actions": ["*"]}, conditioned],
+        ):
+            assert PermissionIndex.build(permissions).grants_all is True
+            result = check_permission(
+                permissions, resource="payments/1", action="pay", context=NoContext(amount=500)
+            )
+            assert result.granted is True
+
+        # A permission with conditions listed first still applies
+        permissions = [conditioned, "*"]
+        assert PermissionIndex.build(permissions).grants_all is False
+        result = check_permission(
+            permissions, resource="payments/1", action="pay", context={"amount": 500}
+        )
+        assert result.granted is False
+
+    def test_permission_list_is_scanned_without_index(self):
+        """Test plain lists are checked directly, giving the same results as an index."""
+        permissions = [
+            {"resource": "users/*", "actions": ["read"]},
+            {
+                "resource": "payments/*",
+                "actions": ["*"],
+                "conditions": {"max_transaction_amount": 100},
+            },
+            "delete",
+        ]
+        index = PermissionIndex.build(permissions)
+        cases = [
+            ("users/1", "read", None),
+            ("users/1", "write", None),
+            ("payments/1", "pay", {"amount": 500}),
+            ("payments/1", "pay", {"amount": 50}),
+            ("orders/1", "delete", None),
+        ]
+
+        with patch.object(PermissionIndex, "build") as build:
+            results = [
+                check_permission(permissions, resource=r, action=a, context=c)
+                for r, a, c in cases
+            ]
+        build.assert_not_called()
+
+        assert results == [
+            check_permission(index, resource=r, action=a, context=c) for r, a, c in cases
+        ]
+        assert [r.granted for r in results] == [True, False, False, True, True]
+
     def test_structured_permission_resource_match(self):
         """Test structured permission with resource matching."""
         permissions = [
@@ -323,3 +1007,233 @@ class TestCheckPermission:
             action="read",
         )
         assert result["granted"] is True
+
+    def test_permission_is_immutable(self):
+        """Test permissions can't change after their matchers are compiled."""
+        from pydantic import ValidationError
+
+        from agentid.types import Permission
+
+        perm = Permission(resource="https://api.example.com/*", actions=["read"])
+
+        with pytest.raises(ValidationError):
+            perm.resource = "*"
+        assert isinstance(perm.actions, tuple)
+        assert check_permission([perm], resource="other", action="read").granted is False
+
+        # Copies are matched against their own fields
+        copy = perm.model_copy(update={"resource": "*", "actions": ("write",)})
+        index = PermissionIndex.build([copy])
+        assert check_permission(index, resource="other", action="write").granted is True
+        assert check_permission(index, resource="other", action="read").granted is False
+
+    def test_permission_index_preserves_order(self):
+        """Test an index checks permissions in their original order."""
+        permissions = [
+            {
+                "resource": "https://api.example.com/payments/*",
+                "actions": ["*"],
+                "conditions": {"max_transaction_amount": 100},
+            },
+            "write",
+        ]
+        index = PermissionIndex.build(permissions)
+
+        # The wildcard permission comes first, so its limit applies
+        result = check_permission(
+            index,
+            resource="https://api.example.com/payments/new",
+            action="write",
+            context={"amount": 500},
+        )
+        assert result["granted"] is False
+
+        # Other resources fall through to the string permission
+        result = check_permission(
+            index,
+            resource="https://api.example.com/users/1",
+            action="write",
+            context={"amount": 500},
+        )
+        assert result["granted"] is True
+
+        # Actions nobody mentions only see the wildcard permission
+        assert index.candidates("delete") == index.wildcard
+
+        # Resource matchers line up with the candidates
+        assert len(index.resource_matchers("write")) == 2
+        assert index.resource_matchers("write")[1] is None
+        assert len(index.resource_matchers("delete")) == 1
+
+    def test_permission_index_cached_on_credential(self):
+        """Test the index is built once per credential."""
+        credential = CredentialPayload(
+            credential_id="cred_123",
+            agent_id="agent_123",
+            agent_name="Test Agent",
+            issuer={"issuer_id": "issuer_123", "name": "Test Issuer"},
+            permissions=["read"],
+            constraints={
+                "valid_from": "2024-01-01T00:00:00Z",
+                "valid_until": "2099-01-01T00:00:00Z",
+            },
+            signature="sig",
+        )
+
+        index = PermissionIndex.from_credential(credential)
+
+        assert PermissionIndex.from_credential(credential) is index
+        assert check_permission(index, resource="any", action="read")["granted"] is True
+
+    def test_pickle_round_trip(self):
+        """Test permissions, credentials and results pickle with a cached index."""
+        import pickle
+
+        credential = CredentialPayload(
+            credential_id="cred_123",
+            agent_id="agent_123",
+            agent_name="Test Agent",
+            issuer={"issuer_id": "issuer_123", "name": "Test Issuer"},
+            permissions=[
+                {"resource": "https://api.example.com/users/*", "actions": ["read"]},
+                {"resource": "*.json", "actions": ["read"]},
+                {"resource": "*/admin/*", "actions": ["write"]},
+                {"resource": "https://api.example.com/v?/*", "actions": ["*"]},
+                {"resource": "https://api.example.com/health", "actions": ["read"]},
+            ],
+            constraints={
+                "valid_from": "2024-01-01T00:00:00Z",
+                "valid_until": "2099-01-01T00:00:00Z",
+            },
+            signature="sig",
+        )
+        PermissionIndex.from_credential(credential)
+        result = VerificationResult(valid=True, credential=credential)
+
+        restored = pickle.loads(pickle.dumps(result))
+
+        assert restored.model_dump() == result.model_dump()
+        assert pickle.loads(pickle.dumps(credential.permissions[0])) == credential.permissions[0]
+        assert restored.credential._permission_index is not None
+        index = PermissionIndex.from_credential(restored.credential)
+        for resource, action in [
+            ("https://api.example.com/users/1", "read"),
+            ("https://other.example.com/data.json", "read"),
+            ("https://api.example.com/admin/x", "write"),
+            ("https://api.example.com/v2/orders", "delete"),
+            ("https://api.example.com/health", "read"),
+            ("https://api.example.com/orders", "read"),
+        ]:
+            expected = check_permission(credential.permissions, resource=resource, action=action)
+            assert check_permission(index, resource=resource, action=action) == expected
+
+    def test_permission_decision_fields(self):
+        """Test decisions expose fields, and grants share one instance."""
+        granted = check_permission(["read"], resource="any", action="read")
+        denied = check_permission(["read"], resource="any", action="write")
+
+        assert granted.granted is True
+        assert granted.reason is None
+        assert check_permission(["read"], resource="other", action="read") is granted
+        assert denied.granted is False
+        assert denied.reason == "No permission for write on any"
+        assert denied.get("reason") == denied["reason"] == denied.reason
+        assert granted.get("reason", "") == ""
+        with pytest.raises(KeyError):
+            denied["missing"]
+
+        # Decisions still behave like the dicts check_permission used to return
+        assert granted == {"granted": True}
+        assert denied == {"granted": False, "reason": "No permission for write on any"}
+        assert granted != {"granted": False}
+        assert "granted" in granted and "reason" not in granted
+        assert "reason" in denied
+        assert dict(denied) == {"granted": False, "reason": "No permission for write on any"}
+        assert granted == (True, None) and hash(granted) == hash((True, None))
+
+    def test_resource_patterns_match_like_fnmatch(self):
+        """Test fast-path resource matching agrees with fnmatch."""
+        patterns = [
+            "https://api.example.com/users/*",
+            "https://api.example.com/users",
+            "*",
+            "*/users/*",
+            "https://api.example.com/users/?",
+            "https://api.example.com/[ab]*",
+            "*/users",
+            "*example*",
+            "**",
+            "",
+        ]
+        resources = [
+            "https://api.example.com/users/1",
+            "https://api.example.com/users/1/posts",
+            "https://api.example.com/users",
+            "https://api.example.com/users/",
+            "https://api.example.com/a/1",
+            "https://other.example.com/users/1",
+            "",
+        ]
+
+        for pattern in patterns:
+            perm = Permission(resource=pattern, actions=["read"])
+            for resource in resources:
+                granted = check_permission([perm], resource=resource, action="read").granted
+                assert granted is fnmatch.fnmatchcase(resource, pattern), (pattern, resource)
+
+    def test_large_buckets_match_first_permission(self):
+        """Test the combined regex for large buckets finds the first match, like a scan."""
+        permissions = [
+            {"resource": f"https://api.example.com/team{i}/*", "actions": ["read"]}
+            for i in range(20)
+        ]
+        permissions[5] = {
+            "resource": "https://api.example.com/*/payments",
+            "actions": ["read"],
+            "conditions": {"allowed_regions": ["EU"]},
+        }
+        permissions.append({"resource": "*.json", "actions": ["read"]})
+        index = PermissionIndex.build(permissions)
+        assert not index.combined  # Compiled on first check, not at build time
+        assert index.combined_pattern("read") is not None
+
+        context = {"region": "US"}
+        for resource in [
+            "https://api.example.com/team3/users",
+            "https://api.example.com/team3/payments",
+            "https://api.example.com/team7/payments",
+            "https://api.example.com/team19/x",
+            "https://other.example.com/data.json",
+            "https://other.example.com/data",
+        ]:
+            expected = False
+            for perm in permissions:
+                if fnmatch.fnmatchcase(resource, perm["resource"]):
+                    expected = "conditions" not in perm
+                    break
+            decision = check_permission(index, resource=resource, action="read", context=context)
+            assert decision.granted is expected, resource
+
+    def test_prefix_prefilter(self):
+        """Test resources outside every literal prefix are denied up front."""
+        index = PermissionIndex.build(
+            [
+                {"resource": "https://api.example.com/users/*", "actions": ["read"]},
+                {"resource": "https://api.example.com/*/posts", "actions": ["read"]},
+                {"resource": "*", "actions": ["write"]},
+            ]
+        )
+
+        assert index.could_match("read", "https://api.example.com/users/1")
+        assert not index.could_match("read", "https://other.example.com/users/1")
+        assert index.could_match("write", "anything")
+        assert not index.could_match("delete", "https://api.example.com/users/1")
+
+        decision = check_permission(
+            index, resource="https://other.example.com/users/1", action="read"
+        )
+        assert not decision.granted
+        assert decision.reason == "No permission for read on https://other.example.com/users/1"
+        assert check_permission(
+            index, resource="https://api.example.com/a/posts", action="read"
+        ).granted